@@ -8,10 +8,14 @@ Uses the downloaded cis-lmu/glotlid model for advanced language detection
 import fasttext
 import numpy as np
 import os
+import re
 from logger_config import get_logger
 
 logger = get_logger(__name__, level="INFO")
 
+_NEWLINE_TO_SPACE = {ord('\n'): ' '}
+_WHITESPACE_RE = re.compile(r'\s+')
+
 class GLotLID:
     """Wrapper class for GLotLID language identification"""
     
@@ -29,7 +33,7 @@ class GLotLID:
         
         # Load FastText model
         self.model = fasttext.load_model(model_path)
-        logger.info(f"✅ GLotLID model loaded from: {model_path}")
+        logger.info("✅ GLotLID model loaded from: %s", model_path)
         
         # Update global reference
         _glotlid_model = self
@@ -60,7 +64,8 @@ class GLotLID:
         
         for category, config in self.threshold_config.items():
             if config['min_chars'] <= text_length < config['max_chars']:
-                logger.debug(f"Text length: {text_length} chars, Category: {category}, Threshold: {config['threshold']}")
+                logger.debug("Text length: %s chars, Category: %s, Threshold: %s",
+                             text_length, category, config['threshold'])
                 return config['threshold']
         
         # Fallback
@@ -68,10 +73,8 @@ class GLotLID:
     
     def _normalize_text(self, text):
         """Normalize input text"""
-        import re
-        replacement_map = {ord(c): ' ' for c in '\n'}
-        text = text.translate(replacement_map)
-        return re.sub(r'\s+', ' ', text).strip()
+        text = text.translate(_NEWLINE_TO_SPACE)
+        return _WHITESPACE_RE.sub(' ', text).strip()
     
     def predict(self, text, k=1):
         """
@@ -103,7 +106,34 @@ class GLotLID:
         
         return labels, probs
     
-    def predict_language(self, text, k=1, threshold=None):
+    def predict_batch(self, texts, k=1):
+        """
+        Predict language(s) for many texts with a single model call
+        
+        FastText's multiline predict runs the whole batch in C++, so the
+        Python/C++ boundary is crossed once instead of once per text.
+        
+        Args:
+            texts: List of input texts
+            k: Number of top predictions to return per text
+            
+        Returns:
+            list: (labels, probabilities) tuple per text, same shape as predict()
+        """
+        if not texts:
+            return []
+        
+        normalized_texts = [self._normalize_text(text) for text in texts]
+        try:
+            all_labels, all_probs = self.model.predict(normalized_texts, k=k)
+        except ValueError:
+            # Same NumPy 2.x compatibility issue as in predict(); fall back to
+            # its guarded per-text path rather than losing the whole batch
+            return [self.predict(text, k=k) for text in texts]
+        
+        return [(labels, np.asarray(probs)) for labels, probs in zip(all_labels, all_probs)]
+    
+    def predict_language(self, text, k=1, threshold=None, predictions=None):
         """
         Predict language with detailed information
         
@@ -111,6 +141,8 @@ class GLotLID:
             text: Input text
             k: Number of predictions
             threshold: Minimum confidence for code-mixed detection (auto-calculated if None)
+            predictions: Precomputed (labels, probabilities) to reuse instead of
+                querying the model again
             
         Returns:
             dict: {
@@ -127,7 +159,10 @@ class GLotLID:
         if threshold is None:
             threshold = self._get_adaptive_threshold(text)
         
-        labels, probs = self.predict(text, k=min(k, 5))
+        if predictions is not None:
+            labels, probs = predictions
+        else:
+            labels, probs = self.predict(text, k=min(k, 5))
         
         # Determine text length category for reporting
         text_length = len(text.strip())
@@ -317,7 +352,7 @@ class GLotLID:
                 final_language = romanized_iso
                 final_confidence = romanized_confidence
                 detection_method = 'romanized_ensemble'
-                logger.info(f"🔄 Romanized boost: {romanized_lang} ({romanized_confidence:.2f}) overrides GLotLID")
+                logger.debug("🔄 Romanized boost: %s (%.2f) overrides GLotLID", romanized_lang, romanized_confidence)
         
         return {
             **glotlid_result,
@@ -424,7 +459,7 @@ class GLotLID:
         return is_english, confidence, matched_words
     
     def ensemble_predict(self, text, romanized_lang=None, romanized_confidence=0.0, 
-                        glotlid_high_conf_threshold=0.90, k=3):
+                        glotlid_high_conf_threshold=0.90, k=3, predictions=None):
         """
         FIX #8: Advanced ensemble prediction combining GLotLID and romanized detection
         FIX #11: Added English word validation to catch false positives
@@ -441,6 +476,8 @@ class GLotLID:
             romanized_confidence: Confidence of romanized detection (0.0-1.0)
             glotlid_high_conf_threshold: Threshold for GLotLID preference (default: 0.90)
             k: Number of top predictions to consider
+            predictions: Precomputed (labels, probabilities) to reuse instead of
+                querying the model again
             
         Returns:
             dict: {
@@ -454,16 +491,19 @@ class GLotLID:
             }
         """
         # Get GLotLID prediction
-        glotlid_result = self.predict_language(text, k=k)
+        glotlid_result = self.predict_language(text, k=k, predictions=predictions)
         glotlid_lang = glotlid_result['primary_language']
         glotlid_conf = glotlid_result['confidence']
         
         # FIX #11: Check if text is actually English to catch false positives
         is_english, english_conf, english_words = self._check_english_words(text)
-        if is_english and english_conf > 0.7 and glotlid_lang != 'eng':
+        english_override = is_english and english_conf > 0.7
+        # Preview shared by both English validator warnings below
+        text_preview = f"{text[:50]}{'...' if len(text) > 50 else ''}" if english_override else ''
+        if english_override and glotlid_lang != 'eng':
             logger.warning(f"[English Validator] FIX #11: GLotLID detected '{glotlid_lang}' but text contains "
                           f"{len(english_words)} English words ({english_conf:.2%} confidence). "
-                          f"Overriding to English. Text: '{text[:50]}{'...' if len(text) > 50 else ''}'")
+                          f"Overriding to English. Text: '{text_preview}'")
             glotlid_lang = 'eng'
             glotlid_conf = english_conf
             glotlid_result['primary_language'] = 'eng'
@@ -502,22 +542,23 @@ class GLotLID:
                                   f"({glotlid_high_conf_threshold}). Trusting GLotLID completely.")
             ensemble_scores['combined_score'] = glotlid_conf
             
-            logger.debug(f"[Ensemble] GLotLID HIGH CONFIDENCE: {glotlid_lang} ({glotlid_conf:.3f}) > {glotlid_high_conf_threshold}")
+            logger.debug("[Ensemble] GLotLID HIGH CONFIDENCE: %s (%.3f) > %s",
+                         glotlid_lang, glotlid_conf, glotlid_high_conf_threshold)
         
         # Case 2: Romanized detection available with good confidence
         elif romanized_lang and romanized_confidence > 0.0:
             # FIX #11: Check if text is actually English before trusting romanized detection
-            if is_english and english_conf > 0.7 and romanized_lang != 'eng':
+            if english_override and romanized_lang != 'eng':
                 logger.warning(f"[English Validator] FIX #11: Romanized detected '{romanized_lang}' but text contains "
                               f"{len(english_words)} English words ({english_conf:.2%} confidence). "
-                              f"Overriding to English. Text: '{text[:50]}{'...' if len(text) > 50 else ''}'")
+                              f"Overriding to English. Text: '{text_preview}'")
                 final_language = 'eng'
                 final_confidence = english_conf
                 detection_method = 'english_validated_override_romanized'
                 decision_explanation = (f"English validation ({english_conf:.3f}) overrides romanized detection "
                                       f"{romanized_lang} ({romanized_confidence:.3f}). Matched {len(english_words)} English words.")
                 ensemble_scores['combined_score'] = english_conf
-                logger.debug(f"[Ensemble] ENGLISH VALIDATION: eng ({english_conf:.3f})")
+                logger.debug("[Ensemble] ENGLISH VALIDATION: eng (%.3f)", english_conf)
             # Check if text is mostly Latin (potential romanized)
             elif latin_percentage > 60:
                 # Weighted ensemble approach
@@ -552,14 +593,15 @@ class GLotLID:
                         detection_method = 'glotlid_preferred_conf_gap'
                         decision_explanation = (f"GLotLID confidence ({glotlid_conf:.3f}) significantly higher "
                                               f"than romanized ({romanized_confidence:.3f}). Gap: {conf_gap:.3f}")
-                        logger.debug(f"[Ensemble] GLotLID preferred (conf gap): {glotlid_lang} ({glotlid_conf:.3f})")
+                        logger.debug("[Ensemble] GLotLID preferred (conf gap): %s (%.3f)", glotlid_lang, glotlid_conf)
                     else:
                         final_language = romanized_lang
                         final_confidence = romanized_confidence
                         detection_method = 'romanized_preferred_conf_gap'
                         decision_explanation = (f"Romanized confidence ({romanized_confidence:.3f}) significantly higher "
                                               f"than GLotLID ({glotlid_conf:.3f}). Gap: {conf_gap:.3f}")
-                        logger.debug(f"[Ensemble] Romanized preferred (conf gap): {romanized_lang} ({romanized_confidence:.3f})")
+                        logger.debug("[Ensemble] Romanized preferred (conf gap): %s (%.3f)",
+                                     romanized_lang, romanized_confidence)
                 else:
                     # Small confidence gap - use weighted ensemble
                     # Check if both methods agree on language family
@@ -576,7 +618,8 @@ class GLotLID:
                                               f"Romanized {romanized_lang} ({romanized_confidence:.3f}) > "
                                               f"GLotLID {glotlid_lang} ({glotlid_conf:.3f}). "
                                               f"Combined score: {combined_score:.3f}")
-                        logger.debug(f"[Ensemble] Weighted ROMANIZED: {romanized_lang} (combined: {combined_score:.3f})")
+                        logger.debug("[Ensemble] Weighted ROMANIZED: %s (combined: %.3f)",
+                                     romanized_lang, combined_score)
                     elif glotlid_is_indian and not romanized_is_indian:
                         # GLotLID detected Indian lang, romanized didn't - trust GLotLID
                         final_language = glotlid_lang
@@ -585,7 +628,8 @@ class GLotLID:
                         decision_explanation = (f"Weighted ensemble: GLotLID detected Indian language {glotlid_lang}, "
                                               f"romanized detected {romanized_lang}. Using GLotLID. "
                                               f"Combined score: {combined_score:.3f}")
-                        logger.debug(f"[Ensemble] Weighted GLOTLID (Indian): {glotlid_lang} (combined: {combined_score:.3f})")
+                        logger.debug("[Ensemble] Weighted GLOTLID (Indian): %s (combined: %.3f)",
+                                     glotlid_lang, combined_score)
                     else:
                         # Use higher confidence method with combined score
                         if glotlid_conf >= romanized_confidence:
@@ -596,7 +640,8 @@ class GLotLID:
                                                   f"GLotLID {glotlid_lang} ({glotlid_conf:.3f}) >= "
                                                   f"Romanized {romanized_lang} ({romanized_confidence:.3f}). "
                                                   f"Combined score: {combined_score:.3f}")
-                            logger.debug(f"[Ensemble] Weighted GLOTLID: {glotlid_lang} (combined: {combined_score:.3f})")
+                            logger.debug("[Ensemble] Weighted GLOTLID: %s (combined: %.3f)",
+                                         glotlid_lang, combined_score)
                         else:
                             final_language = romanized_lang
                             final_confidence = combined_score
@@ -605,7 +650,8 @@ class GLotLID:
                                                   f"Romanized {romanized_lang} ({romanized_confidence:.3f}) > "
                                                   f"GLotLID {glotlid_lang} ({glotlid_conf:.3f}). "
                                                   f"Combined score: {combined_score:.3f}")
-                            logger.debug(f"[Ensemble] Weighted ROMANIZED: {romanized_lang} (combined: {combined_score:.3f})")
+                            logger.debug("[Ensemble] Weighted ROMANIZED: %s (combined: %.3f)",
+                                         romanized_lang, combined_score)
             else:
                 # Not much Latin text - trust GLotLID
                 final_language = glotlid_lang
@@ -614,7 +660,7 @@ class GLotLID:
                 decision_explanation = (f"Low Latin percentage ({latin_percentage:.1f}%). "
                                       f"Trusting GLotLID {glotlid_lang} ({glotlid_conf:.3f})")
                 ensemble_scores['combined_score'] = glotlid_conf
-                logger.debug(f"[Ensemble] GLotLID (low Latin): {glotlid_lang} ({glotlid_conf:.3f})")
+                logger.debug("[Ensemble] GLotLID (low Latin): %s (%.3f)", glotlid_lang, glotlid_conf)
         
         # Case 3: No romanized detection - use GLotLID
         else:
@@ -623,7 +669,7 @@ class GLotLID:
             detection_method = 'glotlid_only'
             decision_explanation = f"No romanized detection available. Using GLotLID {glotlid_lang} ({glotlid_conf:.3f})"
             ensemble_scores['combined_score'] = glotlid_conf
-            logger.debug(f"[Ensemble] GLotLID only: {glotlid_lang} ({glotlid_conf:.3f})")
+            logger.debug("[Ensemble] GLotLID only: %s (%.3f)", glotlid_lang, glotlid_conf)
         
         return {
             'final_language': final_language,
@@ -136,13 +136,17 @@ def log_performance(logger: logging.Logger):
     def decorator(func):
         @wraps(func)
         def wrapper(*args, **kwargs):
+            # Decorated functions sit on hot paths; only format debug messages when they will be emitted
+            debug_enabled = logger.isEnabledFor(logging.DEBUG)
             start_time = time.time()
-            logger.debug(f"Starting {func.__name__}")
+            if debug_enabled:
+                logger.debug(f"Starting {func.__name__}")
             
             try:
                 result = func(*args, **kwargs)
-                elapsed = (time.time() - start_time) * 1000  # ms
-                logger.debug(f"Completed {func.__name__} in {elapsed:.2f}ms")
+                if debug_enabled:
+                    elapsed = (time.time() - start_time) * 1000  # ms
+                    logger.debug(f"Completed {func.__name__} in {elapsed:.2f}ms")
                 return result
             except Exception as e:
                 elapsed = (time.time() - start_time) * 1000
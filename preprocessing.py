@@ -2178,6 +2178,9 @@ def get_language_statistics(text: str) -> Dict:
     # Get detailed language detection
     detailed_analysis = detect_language(text, detailed=True)
     
+    # Preprocess once and reuse for both the length test and the preview
+    cleaned = preprocess_text(text)
+
     # Additional statistics
     stats = {
         'text_length': len(text),
@@ -2185,7 +2188,7 @@ def get_language_statistics(text: str) -> Dict:
         'language_detection': detailed_analysis,
         'preprocessing_preview': {
             'original': text[:100] + '...' if len(text) > 100 else text,
-            'cleaned': preprocess_text(text)[:100] + '...' if len(preprocess_text(text)) > 100 else preprocess_text(text)
+            'cleaned': cleaned[:100] + '...' if len(cleaned) > 100 else cleaned
         }
     }
     
@@ -59,7 +59,8 @@ from .romanized_detection import (
 )
 
 from .code_mixing_detection import (
-    detect_code_mixing
+    detect_code_mixing,
+    detect_code_mixing_batch
 )
 
 from .glotlid_detection import (
@@ -78,7 +79,8 @@ from .text_preprocessing_core import (
 from .language_detection import (
     detect_language,
     get_language_statistics,
-    detect_language_simple
+    detect_language_simple,
+    detect_language_batch
 )
 
 __all__ = [
@@ -113,6 +115,7 @@ __all__ = [
     
     # Code mixing
     'detect_code_mixing',
+    'detect_code_mixing_batch',
     
     # GLotLID
     'get_glotlid_model',
@@ -129,4 +132,5 @@ __all__ = [
     'detect_language',
     'get_language_statistics',
     'detect_language_simple',
+    'detect_language_batch',
 ]
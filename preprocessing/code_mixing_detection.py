@@ -1,16 +1,265 @@
 import re
+from functools import lru_cache
 import numpy as np
-from typing import Dict, Optional, Union
+from typing import Dict, Iterable, List, NamedTuple, Optional, Tuple, Union
 
 from .language_constants import ROMANIZED_INDIAN_PATTERNS
-from .detection_config import DETECTION_CONFIG
-from .script_detection import analyze_text_composition
+from .detection_config import DETECTION_CONFIG, _register_config_listener
+from .script_detection import detect_script_based_language, _codepoint_array, _ASCII_LATIN_BYTES
+
+
+# Patterns compiled once at import instead of being re-resolved on every call,
+# flattened in ROMANIZED_INDIAN_PATTERNS order
+_COMPILED_ROMANIZED_PATTERNS = tuple(
+    re.compile(pattern) for patterns in ROMANIZED_INDIAN_PATTERNS.values() for pattern in patterns
+)
+
+# Parallel per-language arrays, indexed like the per-call marker counts.
+# Languages without an ISO code of their own (generic_indic) map to None.
+_ROMANIZED_LANG_CODES = {'marathi': 'mar', 'hindi': 'hin', 'tamil': 'tam'}
+_ROMANIZED_LANGS = tuple(ROMANIZED_INDIAN_PATTERNS)
+_ROMANIZED_LANG_ISO = tuple(_ROMANIZED_LANG_CODES.get(lang) for lang in _ROMANIZED_LANGS)
+
+# Word tokens as seen by \b...\b patterns: a \b(w1|w2)\b pattern matches exactly
+# the \w+ runs of the text that equal one of its alternatives
+_WORD_RE = re.compile(r'\w+')
+_LITERAL_ALTERNATION = re.compile(r'\\b\((\w+(?:\|\w+)*)\)\\b')
+
+# Short mixed-script texts are counted with character-class regexes; NumPy's
+# fixed per-call overhead only pays off on longer inputs
+_NUMPY_SCRIPT_COUNT_MIN_LENGTH = 160
+_DEVANAGARI_RUN_RE = re.compile('[\u0900-\u097F]+')
+_LATIN_RUN_RE = re.compile('[A-Za-z]+')
+
+
+def _index_romanized_patterns():
+    """
+    Turn the plain \\b(word|...)\\b romanized patterns into a word lookup table
+    
+    Returns:
+        Tuple[Dict[str, Tuple[Tuple[int, int], ...]], Tuple, Tuple]: word ->
+        ((language index, number of patterns listing the word), ...); (language
+        index, compiled pattern) pairs for patterns that are not plain word
+        alternations and still need the regex engine; and the word set of each
+        pattern in _COMPILED_ROMANIZED_PATTERNS order (None for those fallbacks)
+    """
+    word_index = {}
+    regex_fallback = []
+    pattern_words = []
+    for lang_index, patterns in enumerate(ROMANIZED_INDIAN_PATTERNS.values()):
+        for pattern in patterns:
+            literal = _LITERAL_ALTERNATION.fullmatch(pattern)
+            if literal is None:
+                regex_fallback.append((lang_index, re.compile(pattern)))
+                pattern_words.append(None)
+                continue
+            words = frozenset(literal.group(1).split('|'))
+            pattern_words.append(words)
+            for word in words:
+                lang_counts = word_index.setdefault(word, {})
+                lang_counts[lang_index] = lang_counts.get(lang_index, 0) + 1
+    word_index = {word: tuple(lang_counts.items()) for word, lang_counts in word_index.items()}
+    return word_index, tuple(regex_fallback), tuple(pattern_words)
+
+
+_ROMANIZED_WORD_INDEX, _ROMANIZED_REGEX_FALLBACK, _ROMANIZED_PATTERN_WORDS = _index_romanized_patterns()
+
+# Number of literal patterns listing each word, across all languages
+_ROMANIZED_WORD_WEIGHTS = {
+    word: sum(pattern_count for _, pattern_count in lang_counts)
+    for word, lang_counts in _ROMANIZED_WORD_INDEX.items()
+}
+
+# One alternation over the fallback patterns for the per-word start-of-word test
+# (it matches at position 0 exactly when one of them does); None if there are none
+_ROMANIZED_FALLBACK_WORD_RE = (
+    re.compile('|'.join(f'(?:{pattern.pattern})' for _, pattern in _ROMANIZED_REGEX_FALLBACK))
+    if _ROMANIZED_REGEX_FALLBACK else None
+)
+
+# English marker vocabulary, one tuple per original \b(...)\b marker pattern.
+# A word listed in several groups counts once per group, as with one findall per pattern.
+_ENGLISH_MARKER_GROUPS = (
+    ('guys', 'let', 'lets', 'with', 'continue', 'journey', 'really', 'actually', 'anyway', 'literally'),
+    ('okay', 'ok', 'yeah', 'yup', 'nope', 'sure', 'maybe', 'perhaps', 'btw', 'omg', 'lol', 'lmao'),
+    ('what', 'when', 'where', 'which', 'who', 'how', 'why', 'whose', 'whom'),
+    ('good', 'bad', 'nice', 'great', 'awesome', 'cool', 'must', 'watch', 'bro', 'dude', 'man'),
+    ('movie', 'shopping', 'market', 'office', 'traffic', 'late', 'tired', 'break', 'party', 'fun'),
+    ('love', 'like', 'want', 'need', 'got', 'get', 'going', 'doing', 'know', 'think', 'feel'),
+    ('just', 'very', 'too', 'so', 'really', 'totally', 'completely', 'absolutely'),
+    ('this', 'that', 'these', 'those', 'here', 'there', 'now', 'then', 'today', 'tomorrow'),
+)
+_ENGLISH_MARKER_GROUP_SETS = tuple(frozenset(group) for group in _ENGLISH_MARKER_GROUPS)
+_ENGLISH_MARKER_WEIGHTS = {}
+for _group in _ENGLISH_MARKER_GROUP_SETS:
+    for _word in _group:
+        _ENGLISH_MARKER_WEIGHTS[_word] = _ENGLISH_MARKER_WEIGHTS.get(_word, 0) + 1
+del _group, _word
+
+
+# Memoization of repeated posts; long texts are rarely repeated verbatim
+_CODE_MIXING_CACHE_SIZE = 4096
+_CODE_MIXING_CACHE_MAX_TEXT_LENGTH = 512
+
+
+class _CodeMixingThresholds(NamedTuple):
+    """Frozen snapshot of the DETECTION_CONFIG values used by detect_code_mixing"""
+    adaptive_short_text: float
+    adaptive_medium_text: float
+    adaptive_long_text: float
+    aggressive_code_mixing: float
+    min_markers: int
+    
+    @classmethod
+    def from_config(cls, config: Dict) -> "_CodeMixingThresholds":
+        return cls(
+            config.get('adaptive_threshold_short_text', 0.12),
+            config.get('adaptive_threshold_medium_text', 0.10),
+            config.get('adaptive_threshold_long_text', 0.08),
+            config.get('aggressive_code_mixing_threshold', 0.25),
+            config.get('code_mixed_min_markers', 2),
+        )
+
+
+# Current thresholds, rebuilt only when update_detection_config changes the config
+_thresholds = _CodeMixingThresholds.from_config(DETECTION_CONFIG)
+
+
+def _refresh_thresholds():
+    global _thresholds
+    _thresholds = _CodeMixingThresholds.from_config(DETECTION_CONFIG)
+
+
+_register_config_listener(_refresh_thresholds)
+
+
+class _PatternStats(NamedTuple):
+    indian_word_count: int
+    english_word_count: int
+    indian_matched_words: Tuple[str, ...]
+    english_matched_words: Tuple[str, ...]
+
+
+class _ScriptStats(NamedTuple):
+    has_diversity: bool
+    devanagari_chars: int
+    latin_chars: int
+    devanagari_percentage: float
+    latin_percentage: float
+    min_devanagari_required: int
+    min_latin_required: int
+
+
+class _TokenStats(NamedTuple):
+    total_words: int
+    indic_tokens: int
+    english_tokens: int
+    neutral_tokens: int
+    indic_ratio: float
+    english_ratio: float
+    neutral_ratio: float
+    indic_ratio_strict: float
+    english_ratio_strict: float
+
+
+class _CodeMixingAnalysis(NamedTuple):
+    """
+    Immutable detailed result, safe to share between callers through the cache
+    
+    to_dict() builds the dict shape detect_code_mixing(detailed=True) returns;
+    the analysis fields are None for the empty_text / no_words early exits.
+    """
+    is_code_mixed: bool
+    primary_language: Optional[str]
+    confidence: float
+    method: str
+    text_category: Optional[str] = None
+    adaptive_threshold_used: Optional[float] = None
+    pattern_based: Optional[_PatternStats] = None
+    script_diversity: Optional[_ScriptStats] = None
+    token_analysis: Optional[_TokenStats] = None
+    
+    def to_dict(self) -> Dict:
+        result = {
+            'is_code_mixed': self.is_code_mixed,
+            'primary_language': self.primary_language,
+            'confidence': self.confidence,
+            'method': self.method
+        }
+        if self.pattern_based is None:
+            return result
+        
+        pattern_based = self.pattern_based._asdict()
+        pattern_based['indian_matched_words'] = list(self.pattern_based.indian_matched_words)
+        pattern_based['english_matched_words'] = list(self.pattern_based.english_matched_words)
+        result['text_category'] = self.text_category
+        result['adaptive_threshold_used'] = self.adaptive_threshold_used
+        result['analysis'] = {
+            'pattern_based': pattern_based,
+            'script_diversity': self.script_diversity._asdict(),
+            'token_analysis': self.token_analysis._asdict()
+        }
+        return result
 
 
 def detect_code_mixing(text: str, detailed: bool = False) -> Union[tuple[bool, Optional[str]], Dict]:
+    """
+    Detect code-mixing (e.g. Hinglish) from script diversity, marker tokens and patterns
+    
+    Results for short texts are memoized per (text, detailed, thresholds).
+    
+    Args:
+        text (str): Input text to analyze
+        detailed (bool): If True, returns the full analysis dict
+        
+    Returns:
+        tuple or Dict: (is_code_mixed, primary_language) or detailed analysis
+    """
+    result = _code_mixing_result(text, detailed, _thresholds)
+    # Each caller gets a fresh dict built from the immutable (possibly cached) analysis
+    return result.to_dict() if detailed else result
+
+
+def detect_code_mixing_batch(texts: Iterable[str], detailed: bool = False) -> List[Union[tuple[bool, Optional[str]], Dict]]:
+    """
+    Detect code-mixing for many texts
+    
+    Results are identical to calling detect_code_mixing on each text; one
+    threshold snapshot is used for the whole batch.
+    
+    Args:
+        texts (Iterable[str]): Input texts to analyze
+        detailed (bool): If True, returns the full analysis dict per text
+        
+    Returns:
+        List: One result per input text, in order
+    """
+    thresholds = _thresholds
+    results = [_code_mixing_result(text, detailed, thresholds) for text in texts]
+    if detailed:
+        return [result.to_dict() for result in results]
+    return results
+
+
+def _code_mixing_result(text: str, detailed: bool,
+                        thresholds: _CodeMixingThresholds) -> Union[tuple[bool, Optional[str]], _CodeMixingAnalysis]:
+    """Route short texts through the memoized analysis"""
+    if not text or len(text) > _CODE_MIXING_CACHE_MAX_TEXT_LENGTH:
+        return _detect_code_mixing_impl(text, detailed, thresholds)
+    return _detect_code_mixing_cached(text, detailed, thresholds)
+
+
+@lru_cache(maxsize=_CODE_MIXING_CACHE_SIZE)
+def _detect_code_mixing_cached(text: str, detailed: bool,
+                               thresholds: _CodeMixingThresholds) -> Union[tuple[bool, Optional[str]], _CodeMixingAnalysis]:
+    return _detect_code_mixing_impl(text, detailed, thresholds)
+
+
+def _detect_code_mixing_impl(text: str, detailed: bool,
+                             thresholds: _CodeMixingThresholds) -> Union[tuple[bool, Optional[str]], _CodeMixingAnalysis]:
     if not text or len(text.strip()) < 3:
         if detailed:
-            return {'is_code_mixed': False, 'primary_language': None, 'confidence': 0.0, 'method': 'empty_text'}
+            return _CodeMixingAnalysis(False, None, 0.0, 'empty_text')
         return (False, None)
 
     text_lower = text.lower()
@@ -19,68 +268,129 @@ def detect_code_mixing(text: str, detailed: bool = False) -> Union[tuple[bool, O
 
     if total_words == 0:
         if detailed:
-            return {'is_code_mixed': False, 'primary_language': None, 'confidence': 0.0, 'method': 'no_words'}
+            return _CodeMixingAnalysis(False, None, 0.0, 'no_words')
         return (False, None)
 
-    config = DETECTION_CONFIG
+    is_ascii = text.isascii()
+    # One scan of the whole text lets Devanagari-free texts skip the per-word check
+    text_has_devanagari = not is_ascii and _DEVANAGARI_RUN_RE.search(text) is not None
+    if not detailed and not text_has_devanagari:
+        # Without Devanagari the script-diversity rule cannot fire, and the token
+        # and pattern rules both need at least two English and two romanized hits
+        english_hits = 0
+        romanized_hits = 0
+        for run in _WORD_RE.findall(text_lower):
+            english_hits += _ENGLISH_MARKER_WEIGHTS.get(run, 0)
+            romanized_hits += _ROMANIZED_WORD_WEIGHTS.get(run, 0)
+        if english_hits < 2:
+            return (False, None)
+        if romanized_hits < 2 and not any(pattern.search(text_lower) for _, pattern in _ROMANIZED_REGEX_FALLBACK):
+            return (False, None)
+
     text_char_length = len(text.strip())
 
     if text_char_length <= 15:
-        adaptive_threshold = config.get('adaptive_threshold_short_text', 0.12)
+        adaptive_threshold = thresholds.adaptive_short_text
         text_category = 'short'
     elif text_char_length <= 30:
-        adaptive_threshold = config.get('adaptive_threshold_medium_text', 0.10)
+        adaptive_threshold = thresholds.adaptive_medium_text
         text_category = 'medium'
     else:
-        adaptive_threshold = config.get('adaptive_threshold_long_text', 0.08)
+        adaptive_threshold = thresholds.adaptive_long_text
         text_category = 'long'
 
-    indian_word_count = 0
-    detected_indian_lang = None
-    indian_matched_words = []
+    # Single pass over the words: pattern marker counts (Method 1) and per-token
+    # classification (Method 3) come from the same \w+ runs
+    romanized_counts = [0] * len(_ROMANIZED_LANGS)
+    english_word_count = 0
+    english_matches = []
+    indian_matches = []
+    english_tokens = 0
+    indic_tokens = 0
+    neutral_tokens = 0
 
-    for lang, patterns in ROMANIZED_INDIAN_PATTERNS.items():
-        for pattern in patterns:
-            matches = re.findall(pattern, text_lower)
-            if matches:
-                indian_word_count += len(matches)
-                indian_matched_words.extend(matches)
-                if lang == 'marathi':
-                    detected_indian_lang = 'mar'
-                elif lang == 'hindi':
-                    detected_indian_lang = 'hin'
-                elif lang == 'tamil':
-                    detected_indian_lang = 'tam'
-                elif not detected_indian_lang:
-                    detected_indian_lang = 'hin'  # Default Hindi
-
-    english_markers = [
-        r'\b(guys|let|lets|with|continue|journey|really|actually|anyway|literally)\b',
-        r'\b(okay|ok|yeah|yup|nope|sure|maybe|perhaps|btw|omg|lol|lmao)\b',
-        r'\b(what|when|where|which|who|how|why|whose|whom)\b',
-        r'\b(good|bad|nice|great|awesome|cool|must|watch|bro|dude|man)\b',
-        r'\b(movie|shopping|market|office|traffic|late|tired|break|party|fun)\b',
-        r'\b(love|like|want|need|got|get|going|doing|know|think|feel)\b',
-        r'\b(just|very|too|so|really|totally|completely|absolutely)\b',
-        r'\b(this|that|these|those|here|there|now|then|today|tomorrow)\b'
-    ]
+    for word in words:
+        # \w+ runs never span whitespace, so the runs of all words are the runs of the text
+        runs = (word,) if word.isalnum() else _WORD_RE.findall(word)
+        for run in runs:
+            run_langs = _ROMANIZED_WORD_INDEX.get(run)
+            if run_langs:
+                for lang_index, pattern_count in run_langs:
+                    romanized_counts[lang_index] += pattern_count
+                if detailed:
+                    indian_matches.append(run)
+            english_weight = _ENGLISH_MARKER_WEIGHTS.get(run)
+            if english_weight:
+                english_word_count += english_weight
+                if detailed:
+                    english_matches.append(run)
 
-    english_word_count = 0
+        if len(word) < 2:
+            neutral_tokens += 1
+            continue
+        # isascii() is a constant-time flag check on CPython strings
+        has_devanagari = (text_has_devanagari and not word.isascii()
+                          and _DEVANAGARI_RUN_RE.search(word) is not None)
+        # Same as matching each \b(...)\b pattern at the start of the word
+        leading_word = runs[0] if runs and word.startswith(runs[0]) else ''
+        is_english_marker = leading_word in _ENGLISH_MARKER_WEIGHTS
+        is_indic_marker = leading_word in _ROMANIZED_WORD_INDEX or (
+            _ROMANIZED_FALLBACK_WORD_RE is not None and _ROMANIZED_FALLBACK_WORD_RE.match(word) is not None)
+        if has_devanagari or is_indic_marker:
+            indic_tokens += 1
+        elif is_english_marker:
+            english_tokens += 1
+        else:
+            neutral_tokens += 1
+
+    for lang_index, pattern in _ROMANIZED_REGEX_FALLBACK:
+        romanized_counts[lang_index] += len(pattern.findall(text_lower))
+
+    indian_word_count = sum(romanized_counts)
+    detected_indian_lang = None
+    for lang_iso, lang_count in zip(_ROMANIZED_LANG_ISO, romanized_counts):
+        if lang_count:
+            # Later languages win; generic markers only default to Hindi
+            detected_indian_lang = lang_iso or detected_indian_lang or 'hin'
+
+    # Matched-word samples are only reported in detailed results
+    indian_matched_words = []
     english_matched_words = []
-    for pattern in english_markers:
-        matches = re.findall(pattern, text_lower)
-        if matches:
-            english_word_count += len(matches)
-            english_matched_words.extend(matches)
+    if detailed:
+        # Rebuilt from the recorded hits in per-pattern findall order; only the
+        # first 10 are reported, so later patterns are skipped once that many exist
+        for pattern_words, pattern in zip(_ROMANIZED_PATTERN_WORDS, _COMPILED_ROMANIZED_PATTERNS):
+            if pattern_words is None:
+                indian_matched_words.extend(pattern.findall(text_lower))
+            else:
+                indian_matched_words.extend(run for run in indian_matches if run in pattern_words)
+            if len(indian_matched_words) >= 10:
+                break
+        # Grouped like the per-pattern findall results: all hits of group 1, then group 2, ...
+        for group in _ENGLISH_MARKER_GROUP_SETS:
+            english_matched_words.extend(word for word in english_matches if word in group)
+            if len(english_matched_words) >= 10:
+                break
 
-    composition_analysis = analyze_text_composition(text)
-    char_codes = np.array([ord(c) for c in text], dtype=np.int32)
+    if is_ascii:
+        # No Devanagari possible; count A-Z/a-z with one C-level byte scan
+        ascii_bytes = text.encode('ascii')
+        devanagari_chars = 0
+        latin_chars = len(ascii_bytes) - len(ascii_bytes.translate(None, _ASCII_LATIN_BYTES))
+    elif len(text) < _NUMPY_SCRIPT_COUNT_MIN_LENGTH:
+        devanagari_chars = sum(map(len, _DEVANAGARI_RUN_RE.findall(text))) if text_has_devanagari else 0
+        latin_chars = sum(map(len, _LATIN_RUN_RE.findall(text)))
+    else:
+        char_codes = _codepoint_array(text)
 
-    devanagari_mask = (char_codes >= 0x0900) & (char_codes <= 0x097F)
-    devanagari_chars = int(np.sum(devanagari_mask))
+        # uint32 wrap-around makes each range test one subtract and one compare:
+        # code points below the range start wrap to huge values
+        devanagari_mask = (char_codes - np.uint32(0x0900)) < 0x80
+        devanagari_chars = int(np.count_nonzero(devanagari_mask))
 
-    latin_mask = ((char_codes >= 65) & (char_codes <= 90)) | ((char_codes >= 97) & (char_codes <= 122))
-    latin_chars = int(np.sum(latin_mask))
+        # Setting the 0x20 bit folds A-Z onto a-z (and no other code point into a-z)
+        latin_mask = ((char_codes | np.uint32(0x20)) - np.uint32(ord('a'))) < 26
+        latin_chars = int(np.count_nonzero(latin_mask))
 
     total_chars = len(text)
     devanagari_percentage = (devanagari_chars / total_chars * 100) if total_chars > 0 else 0
@@ -91,40 +401,13 @@ def detect_code_mixing(text: str, detailed: bool = False) -> Union[tuple[bool, O
 
     has_script_diversity = (devanagari_chars >= min_devanagari and latin_chars >= min_latin)
 
-    english_tokens = 0
-    indic_tokens = 0
-    neutral_tokens = 0
-
-    for word in words:
-        word_clean = word.strip()
-        if len(word_clean) < 2:
-            neutral_tokens += 1
-            continue
-        has_devanagari = any('\u0900' <= c <= '\u097F' for c in word_clean)
-        is_english_marker = any(re.match(pattern, word_clean) for pattern in english_markers)
-        is_indic_marker = any(
-            any(re.match(pattern, word_clean) for pattern in patterns)
-            for patterns in ROMANIZED_INDIAN_PATTERNS.values()
-        )
-        if has_devanagari or is_indic_marker:
-            indic_tokens += 1
-        elif is_english_marker:
-            english_tokens += 1
-        else:
-            neutral_tokens += 1
-
     total_classified = indic_tokens + english_tokens
     if total_classified > 0:
-        indic_ratio_strict = indic_tokens / total_classified
-        english_ratio_strict = english_tokens / total_classified
-        if total_words > 0:
-            indic_ratio = indic_tokens / total_words
-            english_ratio = english_tokens / total_words
-            neutral_ratio = neutral_tokens / total_words
-        else:
-            indic_ratio = english_ratio = neutral_ratio = 0
+        # total_words > 0 here: empty word lists returned early
+        indic_ratio = indic_tokens / total_words
+        english_ratio = english_tokens / total_words
+        neutral_ratio = neutral_tokens / total_words
     else:
-        indic_ratio_strict = english_ratio_strict = 0
         indic_ratio = english_ratio = 0
         neutral_ratio = 1.0
 
@@ -136,7 +419,6 @@ def detect_code_mixing(text: str, detailed: bool = False) -> Union[tuple[bool, O
     if has_script_diversity and devanagari_percentage >= 10 and latin_percentage >= 20:
         is_code_mixed = True
         if devanagari_percentage > latin_percentage:
-            from .script_detection import detect_script_based_language
             script_lang, _ = detect_script_based_language(text)
             primary_language = script_lang if script_lang else 'hin'
         else:
@@ -163,7 +445,7 @@ def detect_code_mixing(text: str, detailed: bool = False) -> Union[tuple[bool, O
                     primary_language = 'eng'
 
             mixing_strength = min(indic_ratio, english_ratio)
-            if mixing_strength >= config.get('aggressive_code_mixing_threshold', 0.25):
+            if mixing_strength >= thresholds.aggressive_code_mixing:
                 confidence = min(0.90, (indic_ratio + english_ratio) * 1.5)
             else:
                 confidence = min(0.85, (indic_ratio + english_ratio) * 1.3)
@@ -172,7 +454,7 @@ def detect_code_mixing(text: str, detailed: bool = False) -> Union[tuple[bool, O
     # FIX: Require minimum 2 words each AND meet marker threshold for pattern-based detection
     elif indian_word_count >= 2 and english_word_count >= 2:
         total_identified = indian_word_count + english_word_count
-        min_markers = config.get('code_mixed_min_markers', 2)
+        min_markers = thresholds.min_markers
         if total_identified >= min_markers:
             is_code_mixed = True
             if indian_word_count > english_word_count:
@@ -183,41 +465,29 @@ def detect_code_mixing(text: str, detailed: bool = False) -> Union[tuple[bool, O
             detection_method = 'pattern_based'
 
     if detailed:
-        return {
-            'is_code_mixed': is_code_mixed,
-            'primary_language': primary_language,
-            'confidence': confidence,
-            'method': detection_method,
-            'text_category': text_category,
-            'adaptive_threshold_used': adaptive_threshold,
-            'analysis': {
-                'pattern_based': {
-                    'indian_word_count': indian_word_count,
-                    'english_word_count': english_word_count,
-                    'indian_matched_words': indian_matched_words[:10],
-                    'english_matched_words': english_matched_words[:10]
-                },
-                'script_diversity': {
-                    'has_diversity': has_script_diversity,
-                    'devanagari_chars': devanagari_chars,
-                    'latin_chars': latin_chars,
-                    'devanagari_percentage': round(devanagari_percentage, 2),
-                    'latin_percentage': round(latin_percentage, 2),
-                    'min_devanagari_required': min_devanagari,
-                    'min_latin_required': min_latin
-                },
-                'token_analysis': {
-                    'total_words': total_words,
-                    'indic_tokens': indic_tokens,
-                    'english_tokens': english_tokens,
-                    'neutral_tokens': neutral_tokens,
-                    'indic_ratio': round(indic_ratio, 3),
-                    'english_ratio': round(english_ratio, 3),
-                    'neutral_ratio': round(neutral_ratio, 3),
-                    'indic_ratio_strict': round(indic_ratio_strict, 3),
-                    'english_ratio_strict': round(english_ratio_strict, 3)
-                }
-            }
-        }
+        # Share of each language among the classified (non-neutral) tokens
+        if total_classified > 0:
+            indic_ratio_strict = indic_tokens / total_classified
+            english_ratio_strict = english_tokens / total_classified
+        else:
+            indic_ratio_strict = english_ratio_strict = 0
+        return _CodeMixingAnalysis(
+            is_code_mixed, primary_language, confidence, detection_method,
+            text_category, adaptive_threshold,
+            _PatternStats(
+                indian_word_count, english_word_count,
+                tuple(indian_matched_words[:10]), tuple(english_matched_words[:10])
+            ),
+            _ScriptStats(
+                has_script_diversity, devanagari_chars, latin_chars,
+                round(devanagari_percentage, 2), round(latin_percentage, 2),
+                min_devanagari, min_latin
+            ),
+            _TokenStats(
+                total_words, indic_tokens, english_tokens, neutral_tokens,
+                round(indic_ratio, 3), round(english_ratio, 3), round(neutral_ratio, 3),
+                round(indic_ratio_strict, 3), round(english_ratio_strict, 3)
+            )
+        )
     else:
         return (is_code_mixed, primary_language)
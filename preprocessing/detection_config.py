@@ -6,8 +6,12 @@ including thresholds, parameters, and configurable behaviors.
 Extracted from preprocessing.py for better modularity.
 """
 
-# Detection thresholds configuration (now configurable instead of hard-coded)
-DETECTION_CONFIG = {
+from types import MappingProxyType
+
+# Detection thresholds configuration (now configurable instead of hard-coded).
+# Only update_detection_config writes to this dict: detector modules keep
+# snapshots of these values that are only refreshed by its listeners.
+_detection_config = {
     'min_text_length': 3,           # Reduced from 5 to handle short text
     'glotlid_threshold': 0.5,       # Minimum GLotLID confidence (was hard-coded 0.7)
     'high_confidence_threshold': 0.8,
@@ -63,8 +67,39 @@ DETECTION_CONFIG = {
     'english_word_min_length': 2,         # Minimum length for English word detection
     'min_conversion_confidence': 0.3,     # Minimum confidence to attempt conversion
     'prefer_dictionary_over_itrans': True, # Prefer dictionary lookups over ITRANS
+    
+    # Opt-in ASCII English fast path: returns 'eng' without GLotLID or the
+    # romanized/code-mixing analysis (off by default - Hinglish full of common
+    # English words can be misrouted)
+    'english_fast_path_enabled': False,   # Enable the common-English-words shortcut
+    'english_fast_path_min_length': 16,   # Min stripped length (ASCII only)
+    'english_fast_path_min_ratio': 0.35,  # Min share of words in COMMON_ENGLISH_WORDS
+    
+    # Opt-in pure-script fast path: text written entirely in one Indic Unicode
+    # block is answered by script analysis alone (off by default - GLotLID is
+    # what separates languages sharing a script, e.g. Hindi/Marathi/Nepali)
+    'script_fast_path_enabled': False,    # Enable the single-Indic-block shortcut
 }
 
+# Public read-only view: item assignment raises TypeError instead of being
+# silently ignored by the detector snapshots
+DETECTION_CONFIG = MappingProxyType(_detection_config)
+
+
+# Callbacks run after update_detection_config changes the config, so
+# detector modules can refresh the values they precompute from it
+_config_listeners = []
+
+
+def _register_config_listener(callback):
+    """
+    Register a no-argument callback to run whenever the config is updated
+    
+    Args:
+        callback: Function called after update_detection_config applies changes
+    """
+    _config_listeners.append(callback)
+
 
 def update_detection_config(**kwargs):
     """
@@ -76,11 +111,17 @@ def update_detection_config(**kwargs):
     Example:
         update_detection_config(min_text_length=2, high_confidence_threshold=0.85)
     """
+    updated = False
     for key, value in kwargs.items():
-        if key in DETECTION_CONFIG:
-            DETECTION_CONFIG[key] = value
+        if key in _detection_config:
+            _detection_config[key] = value
+            updated = True
         else:
             print(f"⚠️ Warning: Unknown config parameter '{key}' ignored")
+    
+    if updated:
+        for callback in _config_listeners:
+            callback()
 
 
 def get_detection_config():
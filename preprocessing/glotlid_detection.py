@@ -7,7 +7,7 @@ Extracted from preprocessing.py for better modularity.
 """
 
 import os
-from typing import Dict, Optional, Tuple
+from typing import Dict, List, Optional, Sequence, Tuple
 
 from logger_config import get_logger
 from glotlid_wrapper import GLotLID
@@ -110,7 +110,65 @@ def get_memory_usage_info() -> Dict:
     }
 
 
-def detect_glotlid_language(text: str, min_length: int = None, threshold: float = None) -> Tuple[Optional[str], float, bool]:
+def _glotlid_predict_raw(text: str, k: int = 3) -> Optional[Tuple[Sequence[str], Sequence[float]]]:
+    """
+    Run a single raw GLotLID prediction
+    
+    Returns the model's top-k labels and scores unchanged, so one model call
+    can be shared between the GLotLID and ensemble paths (both take it as
+    their ``predictions`` argument).
+    
+    Args:
+        text (str): Input text to analyze
+        k (int): Number of top predictions to return
+        
+    Returns:
+        Optional[Tuple[Sequence[str], Sequence[float]]]: (labels, scores) as
+        returned by GLotLID.predict, or None if the model is unavailable or
+        prediction failed
+    """
+    glotlid_model = get_glotlid_model()
+    
+    if glotlid_model is None:
+        return None
+    
+    try:
+        labels, probs = glotlid_model.predict(text, k=k)
+    except Exception as e:
+        logger.warning("GLotLID raw prediction error: %s", e)
+        return None
+    
+    return labels, probs
+
+
+def _glotlid_predict_raw_batch(texts: List[str], k: int = 3) -> List[Optional[Tuple[Sequence[str], Sequence[float]]]]:
+    """
+    Batched counterpart of _glotlid_predict_raw
+    
+    Args:
+        texts (List[str]): Input texts to analyze
+        k (int): Number of top predictions to return per text
+        
+    Returns:
+        List[Optional[Tuple[Sequence[str], Sequence[float]]]]: (labels, scores)
+        per text, or None entries if the model is unavailable or prediction failed
+    """
+    glotlid_model = get_glotlid_model()
+    
+    if glotlid_model is None or not texts:
+        return [None] * len(texts)
+    
+    try:
+        batch_predictions = glotlid_model.predict_batch(texts, k=k)
+    except Exception as e:
+        logger.warning("GLotLID batch prediction error: %s", e)
+        return [None] * len(texts)
+    
+    return batch_predictions
+
+
+def detect_glotlid_language(text: str, min_length: int = None, threshold: float = None,
+                            predictions: Optional[Tuple[Sequence[str], Sequence[float]]] = None) -> Tuple[Optional[str], float, bool]:
     """
     Detect language using GLotLID model with code-mixed detection
     Now supports configurable thresholds and better short text handling
@@ -120,6 +178,7 @@ def detect_glotlid_language(text: str, min_length: int = None, threshold: float
         text (str): Input text to analyze
         min_length (int): Minimum text length (uses config default if None)
         threshold (float): Confidence threshold (uses config default if None)
+        predictions (tuple): Raw (labels, scores) from _glotlid_predict_raw to reuse
         
     Returns:
         Tuple[Optional[str], float, bool]: (detected_language, confidence, is_code_mixed)
@@ -152,7 +211,8 @@ def detect_glotlid_language(text: str, min_length: int = None, threshold: float
             conf_threshold = DETECTION_CONFIG['short_text_glotlid_threshold']  # 0.4
         
         # Predict language with GLotLID
-        result = glotlid_model.predict_language(clean_text, k=3, threshold=conf_threshold)
+        result = glotlid_model.predict_language(clean_text, k=3, threshold=conf_threshold,
+                                                predictions=predictions)
         
         # Extract primary prediction
         primary_lang = result['primary_language']
@@ -139,6 +139,8 @@ HASHTAG_PATTERN = re.compile(r'#(\w+)')
 URL_PATTERN = re.compile(r'http\S+|www\.\S+')
 HTML_ENTITY_PATTERN = re.compile(r'&\w+;')
 WHITESPACE_PATTERN = re.compile(r'\s+')
+
+MINIMAL_PUNCT_PATTERN = re.compile(r'[`"\'\[\]{}\\]')
 NON_ESSENTIAL_PUNCT_PATTERN = re.compile(
     r'[^\w\s\u0900-\u097F\u0A00-\u0A7F\u0A80-\u0AFF\u0B00-\u0B7F\u0B80-\u0BFF'
     r'\u0C00-\u0C7F\u0C80-\u0CFF\u0D00-\u0D7F\u0D80-\u0DFF\u0E00-\u0E7F'
@@ -228,7 +230,7 @@ ROMANIZED_INDIAN_PATTERNS = {
 # =============================================================================
 
 # Common English words for token detection (top 500 most frequent words)
-COMMON_ENGLISH_WORDS = {
+COMMON_ENGLISH_WORDS = frozenset({
     'the', 'be', 'to', 'of', 'and', 'a', 'in', 'that', 'have', 'i',
     'it', 'for', 'not', 'on', 'with', 'he', 'as', 'you', 'do', 'at',
     'this', 'but', 'his', 'by', 'from', 'they', 'we', 'say', 'her', 'she',
@@ -240,32 +242,32 @@ COMMON_ENGLISH_WORDS = {
     'back', 'after', 'use', 'two', 'how', 'our', 'work', 'first', 'well', 'way',
     'even', 'new', 'want', 'because', 'any', 'these', 'give', 'day', 'most', 'us',
     'is', 'was', 'are', 'been', 'has', 'had', 'were', 'said', 'did', 'having',
-    'may', 'should', 'am', 'being', 'might', 'must', 'shall', 'could', 'would',
+    'may', 'should', 'am', 'being', 'might', 'must', 'shall',
     'very', 'much', 'many', 'more', 'such', 'long', 'same', 'through', 'between',
-    'find', 'man', 'here', 'thing', 'give', 'many', 'well', 'every', 'much', 'own',
-    'say', 'part', 'place', 'case', 'week', 'company', 'where', 'system', 'think',
+    'find', 'man', 'here', 'thing', 'every', 'own',
+    'part', 'place', 'case', 'week', 'company', 'where', 'system',
     'each', 'person', 'point', 'hand', 'high', 'follow', 'act', 'why', 'ask', 'try',
     'need', 'feel', 'become', 'leave', 'put', 'mean', 'keep', 'let', 'begin', 'seem',
     'help', 'talk', 'turn', 'start', 'show', 'hear', 'play', 'run', 'move', 'live',
     'believe', 'hold', 'bring', 'happen', 'write', 'provide', 'sit', 'stand', 'lose',
     'pay', 'meet', 'include', 'continue', 'set', 'learn', 'change', 'lead', 'understand',
-    'watch', 'far', 'call', 'ask', 'may', 'end', 'among', 'ever', 'across', 'although',
+    'watch', 'far', 'call', 'end', 'among', 'ever', 'across', 'although',
     'both', 'under', 'last', 'never', 'before', 'always', 'several', 'until', 'away',
-    'something', 'fact', 'less', 'though', 'far', 'put', 'head', 'yet', 'government',
+    'something', 'fact', 'less', 'though', 'head', 'yet', 'government',
     'number', 'night', 'another', 'mr', 'mrs', 'miss', 'ms', 'dr', 'sir', 'madam',
-    'yeah', 'yes', 'no', 'ok', 'okay', 'hi', 'hello', 'bye', 'thanks', 'please',
+    'yeah', 'yes', 'ok', 'okay', 'hi', 'hello', 'bye', 'thanks', 'please',
     'really', 'actually', 'basically', 'literally', 'totally', 'definitely', 'probably',
     'obviously', 'generally', 'usually', 'normally', 'typically', 'mostly', 'mainly',
     'right', 'wrong', 'true', 'false', 'big', 'small', 'great', 'little', 'old', 'young',
     'next', 'few', 'public', 'bad', 'able', 'late', 'hard', 'real', 'best', 'better',
-    'traffic', 'heavy', 'today', 'tomorrow', 'yesterday', 'morning', 'evening', 'night',
-    'meeting', 'office', 'start', 'wait', 'finish', 'complete', 'done', 'ready', 'busy',
-    'free', 'available', 'schedule', 'appointment', 'conference', 'call', 'email', 'message',
+    'traffic', 'heavy', 'today', 'tomorrow', 'yesterday', 'morning', 'evening',
+    'meeting', 'office', 'wait', 'finish', 'complete', 'done', 'ready', 'busy',
+    'free', 'available', 'schedule', 'appointment', 'conference', 'email', 'message',
     'monday', 'tuesday', 'wednesday', 'thursday', 'friday', 'saturday', 'sunday',
     'january', 'february', 'march', 'april', 'june', 'july', 'august', 'september',
-    'october', 'november', 'december', 'am', 'pm', 'going', 'coming', 'doing', 'making',
+    'october', 'november', 'december', 'pm', 'going', 'coming', 'doing', 'making',
     'taking', 'seeing', 'looking', 'feeling', 'thinking', 'trying', 'working', 'playing'
-}
+})
 
 # English-specific patterns
 ENGLISH_PATTERNS = {
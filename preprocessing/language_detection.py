@@ -1,22 +1,153 @@
 
-from typing import Dict, Union, Optional, Tuple, List
-import re
-import numpy as np
+from typing import Dict, Iterable, NamedTuple, Union, Optional, Tuple, List
+import copy
+import zlib
+from functools import lru_cache
+from types import MappingProxyType
 
 from logger_config import get_logger, log_performance
 from validators import TextValidator, validate_inputs
 
-from .language_constants import INDIAN_LANGUAGES, INTERNATIONAL_LANGUAGES, OBSCURE_LANGUAGES
-from .detection_config import DETECTION_CONFIG
-from .script_detection import detect_script_based_language, analyze_text_composition
+from .language_constants import INDIAN_LANGUAGES, INTERNATIONAL_LANGUAGES, OBSCURE_LANGUAGES, COMMON_ENGLISH_WORDS
+from .detection_config import DETECTION_CONFIG, _register_config_listener
+from .script_detection import (
+    detect_script_based_language, analyze_text_composition, _codepoint_array, _ASCII_LATIN_BYTES
+)
 from .romanized_detection import detect_romanized_language, detect_romanized_indian_language
 from .code_mixing_detection import detect_code_mixing
-from .glotlid_detection import detect_glotlid_language, get_glotlid_model
+from .glotlid_detection import (
+    detect_glotlid_language, get_glotlid_model, _glotlid_predict_raw, _glotlid_predict_raw_batch
+)
 from .language_utils import normalize_language_code, get_language_display_name
 
 logger = get_logger(__name__, level="WARNING")
 
 
+class _DetectionThresholds(NamedTuple):
+    """Frozen snapshot of the DETECTION_CONFIG values used by the detection pipeline"""
+    ensemble_min_confidence: float
+    glotlid_threshold: float
+    strong_script_threshold: float
+    high_confidence_threshold: float
+    medium_confidence_threshold: float
+    code_mixed_min_threshold: float
+    code_mixed_max_threshold: float
+    latin_dominance_threshold: float
+    minor_script_min_threshold: float
+    minor_script_max_threshold: float
+    short_text_threshold: int
+    very_short_text_threshold: int
+    ensemble_enabled: bool
+    glotlid_high_confidence_threshold: float
+    disable_early_detection_threshold: int
+    romanized_early_detection_threshold: float
+    glotlid_override_threshold: float
+    short_text_romanized_threshold: float
+    short_text_glotlid_threshold: float
+    short_text_script_threshold: float
+    min_text_length: int
+    english_fast_path_enabled: bool
+    english_fast_path_min_length: int
+    english_fast_path_min_ratio: float
+    script_fast_path_enabled: bool
+    
+    @classmethod
+    def from_config(cls, config: Dict) -> "_DetectionThresholds":
+        return cls(
+            config.get('ensemble_min_combined_confidence', 0.65),
+            config['glotlid_threshold'],
+            config['strong_script_threshold'],
+            config['high_confidence_threshold'],
+            config['medium_confidence_threshold'],
+            config['code_mixed_min_threshold'],
+            config['code_mixed_max_threshold'],
+            config['latin_dominance_threshold'],
+            config['minor_script_min_threshold'],
+            config['minor_script_max_threshold'],
+            config['short_text_threshold'],
+            config['very_short_text_threshold'],
+            config.get('ensemble_enabled', True),
+            config.get('glotlid_high_confidence_threshold', 0.90),
+            config['disable_early_detection_threshold'],
+            config['romanized_early_detection_threshold'],
+            config['glotlid_override_threshold'],
+            config['short_text_romanized_threshold'],
+            config['short_text_glotlid_threshold'],
+            config['short_text_script_threshold'],
+            config['min_text_length'],
+            config.get('english_fast_path_enabled', False),
+            config.get('english_fast_path_min_length', 16),
+            config.get('english_fast_path_min_ratio', 0.35),
+            config.get('script_fast_path_enabled', False),
+        )
+
+
+def _detection_config_version(config: Dict) -> str:
+    """Short fingerprint of the config values, stable across processes"""
+    return format(zlib.crc32(repr(sorted(config.items())).encode()), '08x')
+
+
+class _ReadOnlyConfig(dict):
+    """
+    Config values attached to detailed results
+    
+    One instance per config generation is shared by every detailed result,
+    so it refuses mutation. Copying returns the same object; it is still a
+    plain dict to JSON and pickle.
+    """
+    
+    def _read_only(self, *args, **kwargs):
+        raise TypeError("detection_config is shared and read-only; use get_detection_config() for a copy")
+    
+    __setitem__ = __delitem__ = __ior__ = _read_only
+    clear = pop = popitem = setdefault = update = _read_only
+    
+    def __copy__(self):
+        return self
+    
+    def __deepcopy__(self, memo):
+        return self
+    
+    def __reduce__(self):
+        return _ReadOnlyConfig, (dict(self),)
+
+
+# Current thresholds and the (version, values) config report for detailed results,
+# rebuilt only when update_detection_config changes the config. Every
+# DETECTION_CONFIG read in this module goes through this snapshot, so one
+# call never mixes old and new values (DETECTION_CONFIG itself is a
+# read-only view; changes go through update_detection_config)
+_thresholds = _DetectionThresholds.from_config(DETECTION_CONFIG)
+_config_report = (_detection_config_version(DETECTION_CONFIG), _ReadOnlyConfig(DETECTION_CONFIG))
+# Bumped on every config update; keys the detection cache
+_config_generation = 0
+
+
+def _refresh_thresholds():
+    global _thresholds, _config_report, _config_generation
+    _thresholds = _DetectionThresholds.from_config(DETECTION_CONFIG)
+    _config_report = (_detection_config_version(DETECTION_CONFIG), _ReadOnlyConfig(DETECTION_CONFIG))
+    _config_generation += 1
+
+
+_register_config_listener(_refresh_thresholds)
+
+# Hash-set views of the language tables for the per-call membership tests
+_INDIAN_LANGUAGE_SET = frozenset(INDIAN_LANGUAGES)
+_INTERNATIONAL_LANGUAGE_SET = frozenset(INTERNATIONAL_LANGUAGES)
+_OBSCURE_LANGUAGE_SET = frozenset(OBSCURE_LANGUAGES)
+
+# The Indic scripts occupy consecutive 128-code-point Unicode blocks from
+# Devanagari (U+0900) to Malayalam (U+0D00-U+0D7F)
+_INDIC_BLOCKS_START = 0x0900
+_INDIC_BLOCKS_END = 0x0D80
+
+# Memoization of repeated posts (retweets, canned replies, spam).
+# Long texts are rarely repeated verbatim and would bloat the cache.
+_DETECTION_CACHE_SIZE = 16384
+_DETECTION_CACHE_MAX_TEXT_LENGTH = 2000
+
+
 @log_performance(logger)
 @validate_inputs(
     text=lambda x: TextValidator.validate_text_input(x, min_length=0, max_length=50000)
@@ -38,15 +169,209 @@ def detect_language(text: str, detailed: bool = False) -> Union[str, Dict]:
     
     Raises:
         ValidationError: If input validation fails
+    
+    Note:
+        Results for texts up to 2000 characters are memoized. A repeated call
+        is answered from the cache without running the detectors, so their
+        warning/debug log lines are only emitted for the first call.
+    """
+    if not text or not isinstance(text, str):
+        # None slips through validation; answer it without touching the cache
+        return _detect_language_impl(text, detailed, None, None)
+    
+    if len(text) > _DETECTION_CACHE_MAX_TEXT_LENGTH:
+        return _detect_single(text, detailed)
+    
+    result = _detect_cached(text, detailed, _detection_cache_key())
+    if detailed:
+        # Hand out a mutable copy of the frozen cache entry
+        return _thaw(result)
+    return result
+
+
+def _detection_cache_key() -> Tuple:
+    """
+    Hashable snapshot of everything besides the text that detection depends on
+    
+    Covers config changes made through update_detection_config (via the
+    generation counter) and whether the GLotLID model is available (it can
+    be disabled or unloaded).
+    """
+    return _config_generation, get_glotlid_model() is not None
+
+
+class _FrozenList(tuple):
+    """Read-only stand-in for a list inside a cached detailed result"""
+
+
+def _freeze(value):
+    """Read-only view of a detailed result: dicts become mapping proxies, lists tuples"""
+    if isinstance(value, _ReadOnlyConfig):
+        # Already immutable and shared across results - cache it as is
+        return value
+    if isinstance(value, dict):
+        return MappingProxyType({key: _freeze(item) for key, item in value.items()})
+    if isinstance(value, list):
+        return _FrozenList(_freeze(item) for item in value)
+    if isinstance(value, tuple):
+        return tuple(_freeze(item) for item in value)
+    return value
+
+
+def _thaw(value):
+    """Inverse of _freeze - a fresh, mutable copy of a frozen detailed result"""
+    if isinstance(value, MappingProxyType):
+        return {key: _thaw(item) for key, item in value.items()}
+    if isinstance(value, _FrozenList):
+        return [_thaw(item) for item in value]
+    if isinstance(value, tuple):
+        return tuple(_thaw(item) for item in value)
+    return value
+
+
+@lru_cache(maxsize=_DETECTION_CACHE_SIZE)
+def _detect_cached(text: str, detailed: bool, config_key: Tuple) -> Union[str, Dict]:
+    """
+    Memoized detection; config_key only takes part in the cache lookup
+    
+    Detailed results are stored frozen so a cached entry cannot be changed
+    through a dict handed to a caller.
+    """
+    result = _detect_single(text, detailed)
+    return _freeze(result) if detailed else result
+
+
+def _validate_detection_text(text: str) -> None:
+    """Same input validation detect_language applies, for the batch path"""
+    TextValidator.validate_text_input(text, min_length=0, max_length=50000)
+
+
+def _is_letterless_very_short(text: str) -> bool:
+    """Very short ASCII text without letters (numbers, punctuation, emoticons like ':-)')"""
+    stripped = text.strip()
+    return (len(stripped) <= _thresholds.very_short_text_threshold and stripped.isascii()
+            and not any(c.isalpha() for c in stripped))
+
+
+def _is_common_english_fast_path(text: str) -> bool:
+    """
+    Opt-in shortcut for plain ASCII English: enough of the words are common English words
+    
+    Disabled unless DETECTION_CONFIG['english_fast_path_enabled'] is set.
+    """
+    thresholds = _thresholds
+    if not thresholds.english_fast_path_enabled or not text.isascii():
+        return False
+    if len(text.strip()) < thresholds.english_fast_path_min_length:
+        return False
+    words = text.lower().split()
+    common_words = sum(1 for word in words if word in COMMON_ENGLISH_WORDS)
+    return common_words >= thresholds.english_fast_path_min_ratio * len(words)
+
+
+def _is_pure_script_fast_path(text: str) -> bool:
     """
-    if not text or not text.strip():
+    Opt-in shortcut for text written in a single Indic script block
+    
+    Every non-ASCII character must fall in the same Indic block and the ASCII
+    part must carry no Latin letters (spaces, digits and punctuation are fine).
+    Disabled unless DETECTION_CONFIG['script_fast_path_enabled'] is set.
+    """
+    if not _thresholds.script_fast_path_enabled or text.isascii():
+        return False
+    ascii_part = text.encode('ascii', 'ignore')
+    if len(ascii_part.translate(None, _ASCII_LATIN_BYTES)) != len(ascii_part):
+        return False
+    char_codes = _codepoint_array(text)
+    non_ascii = char_codes[char_codes > 0x7F]
+    first, last = int(non_ascii.min()), int(non_ascii.max())
+    return (_INDIC_BLOCKS_START <= first and last < _INDIC_BLOCKS_END
+            and first >> 7 == last >> 7)
+
+
+def _fast_path(text: str) -> Optional[str]:
+    """
+    Method name of the shortcut that answers text without GLotLID, or None
+    
+    Evaluated once per text; the result decides both whether GLotLID is
+    queried and which branch _detect_language_impl takes.
+    """
+    if _is_letterless_very_short(text):
+        return 'very_short_ascii_skip'
+    if _is_common_english_fast_path(text):
+        return 'ascii_common_words_fast_path'
+    if _is_pure_script_fast_path(text):
+        return 'pure_script_fast_path'
+    return None
+
+
+def _needs_glotlid(text: str, fast_path: Optional[str]) -> bool:
+    """GLotLID is only queried for texts reaching the configured minimum length and no fast path"""
+    return fast_path is None and bool(text) and len(text.strip()) >= _thresholds.min_text_length
+
+
+def _detect_single(text: str, detailed: bool) -> Union[str, Dict]:
+    """Run the pipeline for one text, querying GLotLID only if needed"""
+    fast_path = _fast_path(text)
+    glotlid_predictions = _glotlid_predict_raw(text, k=3) if _needs_glotlid(text, fast_path) else None
+    return _detect_language_impl(text, detailed, fast_path, glotlid_predictions)
+
+
+def _detect_language_impl(text: str, detailed: bool, fast_path: Optional[str],
+                          glotlid_predictions) -> Union[str, Dict]:
+    """
+    Detection pipeline shared by detect_language and detect_language_batch
+    
+    fast_path is the caller's _fast_path(text) result.
+    """
+    stripped = text.strip() if text else ''
+    if not stripped:
         logger.warning("Empty text provided for language detection")
         return 'unknown' if not detailed else {'language': 'unknown', 'confidence': 0.0, 'method': 'empty_text'}
     
-    config = DETECTION_CONFIG
-    text_length = len(text.strip())
-    is_short_text = text_length <= config['short_text_threshold']
-    is_very_short_text = text_length <= config['very_short_text_threshold']
+    # One snapshot of the thresholds serves every rung below
+    thresholds = _thresholds
+    config_report = _config_report
+    text_length = len(stripped)
+    is_short_text = text_length <= thresholds.short_text_threshold
+    is_very_short_text = text_length <= thresholds.very_short_text_threshold
+    
+    # Very short ASCII input without letters carries no language signal:
+    # skip GLotLID and the romanized/code-mixing analysis entirely
+    if fast_path == 'very_short_ascii_skip':
+        if not detailed:
+            return 'unknown'
+        return _build_detailed_result(
+            'unknown', 0.3, 'very_short_ascii_skip',
+            text_length, is_short_text, is_very_short_text,
+            analyze_text_composition(text), None, {},
+            None, 0.0, False,
+            None, 0.0, config_report
+        )
+    
+    if fast_path == 'ascii_common_words_fast_path':
+        if not detailed:
+            return 'eng'
+        return _build_detailed_result(
+            'eng', 0.85, 'ascii_common_words_fast_path',
+            text_length, is_short_text, is_very_short_text,
+            analyze_text_composition(text), None, {},
+            None, 0.0, False,
+            None, 0.0, config_report
+        )
+    
+    if fast_path == 'pure_script_fast_path':
+        script_lang, script_counts = detect_script_based_language(text)
+        language = normalize_language_code(script_lang, keep_suffixes=True)
+        if not detailed:
+            return language.partition('_')[0]
+        return _build_detailed_result(
+            language, 0.95, 'pure_script_fast_path',
+            text_length, is_short_text, is_very_short_text,
+            analyze_text_composition(text), script_lang, script_counts,
+            None, 0.0, False,
+            None, 0.0, config_report
+        )
     
     # Analyze text composition
     composition_analysis = analyze_text_composition(text)
@@ -60,6 +385,7 @@ def detect_language(text: str, detailed: bool = False) -> Union[str, Dict]:
     # Code-mixing detection can be overly sensitive (e.g., single English word triggers it)
     latin_percentage = comp['latin_percentage']
     indic_percentage = comp['indic_percentage']
+    composition_code_mixed = comp['is_code_mixed']
     romanized_lang = None
     romanized_confidence = 0.0
     
@@ -68,17 +394,21 @@ def detect_language(text: str, detailed: bool = False) -> Union[str, Dict]:
         # The ensemble will handle the final decision
         romanized_lang, romanized_confidence = detect_romanized_language(text)
         if is_code_mixed_detected:
-            logger.warning(f"Code-mixed detected: {code_mixed_primary_lang} + English (romanized: {romanized_lang} @ {romanized_confidence:.2f})")
+            logger.warning("Code-mixed detected: %s + English (romanized: %s @ %.2f)",
+                           code_mixed_primary_lang, romanized_lang, romanized_confidence)
     
     # Method 1: Script-based detection
     script_lang, script_counts = detect_script_based_language(text)
     
     # Method 2: GLotLID detection
-    glotlid_lang, glotlid_confidence, glotlid_code_mixed = detect_glotlid_language(text)
+    # The raw scores were queried once by the caller and are shared with the ensemble below
+    glotlid_lang, glotlid_confidence, glotlid_code_mixed = detect_glotlid_language(
+        text, predictions=glotlid_predictions
+    )
     
     # Ensemble fusion
     ensemble_result = None
-    if config.get('ensemble_enabled', True) and glotlid_lang:
+    if thresholds.ensemble_enabled and glotlid_lang:
         glotlid_model = get_glotlid_model()
         if glotlid_model is not None:
             try:
@@ -86,15 +416,19 @@ def detect_language(text: str, detailed: bool = False) -> Union[str, Dict]:
                     text=text,
                     romanized_lang=romanized_lang,
                     romanized_confidence=romanized_confidence,
-                    glotlid_high_conf_threshold=config.get('glotlid_high_confidence_threshold', 0.90),
-                    k=3
+                    glotlid_high_conf_threshold=thresholds.glotlid_high_confidence_threshold,
+                    k=3,
+                    predictions=glotlid_predictions
                 )
-                logger.warning(f"Ensemble result: {ensemble_result['final_language']} ({ensemble_result['final_confidence']:.3f})")
+                logger.warning("Ensemble result: %s (%.3f)",
+                               ensemble_result['final_language'], ensemble_result['final_confidence'])
                 
-                if (ensemble_result['final_confidence'] >= config.get('ensemble_min_combined_confidence', 0.65) and
-                    ensemble_result['final_confidence'] > 0.85 and 
-                    not is_code_mixed_detected and 
-                    text_length > config['disable_early_detection_threshold']):
+                # Cheapest tests first: code-mixed and short texts never return early
+                ensemble_confidence = ensemble_result['final_confidence']
+                if (not is_code_mixed_detected and
+                    text_length > thresholds.disable_early_detection_threshold and
+                    ensemble_confidence > 0.85 and
+                    ensemble_confidence >= thresholds.ensemble_min_confidence):
                     
                     ensemble_lang = ensemble_result['final_language']
                     if detailed:
@@ -105,49 +439,50 @@ def detect_language(text: str, detailed: bool = False) -> Union[str, Dict]:
                             composition_analysis, script_lang, script_counts,
                             glotlid_lang, glotlid_confidence, glotlid_code_mixed,
                             romanized_lang, romanized_confidence,
-                            config, ensemble_result=ensemble_result
+                            config_report, ensemble_result=ensemble_result
                         )
                     return ensemble_lang
             except Exception as e:
-                logger.warning(f"Ensemble prediction failed: {e}")
+                logger.warning("Ensemble prediction failed: %s", e)
                 ensemble_result = None
     
     # Handle romanized detection
-    if ensemble_result is None and romanized_lang and romanized_confidence > config['romanized_early_detection_threshold']:
-        if text_length <= config['disable_early_detection_threshold']:
-            logger.warning(f"Short text ({text_length} chars): Skipping early detection")
-        elif glotlid_lang and glotlid_confidence > config['glotlid_override_threshold']:
-            logger.warning(f"GLotLID override: {glotlid_lang} ({glotlid_confidence:.2f})")
+    if ensemble_result is None and romanized_lang and romanized_confidence > thresholds.romanized_early_detection_threshold:
+        if text_length <= thresholds.disable_early_detection_threshold:
+            logger.warning("Short text (%s chars): Skipping early detection", text_length)
+        elif glotlid_lang and glotlid_confidence > thresholds.glotlid_override_threshold:
+            logger.warning("GLotLID override: %s (%.2f)", glotlid_lang, glotlid_confidence)
             romanized_lang = None
             romanized_confidence = 0.0
         else:
-            required_confidence = config['short_text_romanized_threshold'] if is_short_text else config['romanized_early_detection_threshold']
+            required_confidence = (thresholds.short_text_romanized_threshold if is_short_text
+                                   else thresholds.romanized_early_detection_threshold)
             if romanized_confidence >= required_confidence:
-                logger.warning(f"Romanized Indic: {romanized_lang} ({romanized_confidence:.2f})")
+                logger.warning("Romanized Indic: %s (%.2f)", romanized_lang, romanized_confidence)
                 if detailed:
                     return _build_detailed_result(
                         romanized_lang, romanized_confidence, 'romanized_indic_early_detection',
                         text_length, is_short_text, is_very_short_text,
                         composition_analysis, script_lang, script_counts,
                         glotlid_lang, glotlid_confidence, glotlid_code_mixed,
-                        romanized_lang, romanized_confidence, config
+                        romanized_lang, romanized_confidence, config_report
                     )
                 return romanized_lang
     
     # Filter obscure languages
-    if glotlid_lang in OBSCURE_LANGUAGES and glotlid_confidence < 0.8:
-        logger.warning(f"Obscure language detected: {glotlid_lang}")
+    if glotlid_lang in _OBSCURE_LANGUAGE_SET and glotlid_confidence < 0.8:
+        logger.warning("Obscure language detected: %s", glotlid_lang)
         if latin_percentage > 50:
             rom_lang, rom_conf = detect_romanized_indian_language(text)
             if rom_lang:
-                logger.warning(f"Corrected '{glotlid_lang}' to '{rom_lang}'")
+                logger.warning("Corrected '%s' to '%s'", glotlid_lang, rom_lang)
                 if detailed:
                     return _build_detailed_result(
                         rom_lang, rom_conf, 'obscure_filtered_romanized_detected',
                         text_length, is_short_text, is_very_short_text,
                         composition_analysis, script_lang, script_counts,
                         glotlid_lang, glotlid_confidence, glotlid_code_mixed,
-                        rom_lang, rom_conf, config
+                        rom_lang, rom_conf, config_report
                     )
                 return rom_lang
         glotlid_lang = 'unknown'
@@ -156,88 +491,113 @@ def detect_language(text: str, detailed: bool = False) -> Union[str, Dict]:
     # Core detection logic
     detected_language, detection_method, final_confidence = _detect_language_core(
         text, text_length, is_short_text, is_very_short_text,
-        composition_analysis, script_lang, script_counts,
+        indic_percentage, latin_percentage, composition_code_mixed, script_lang,
         glotlid_lang, glotlid_confidence, glotlid_code_mixed,
         romanized_lang, romanized_confidence,
         is_code_mixed_detected, code_mixed_primary_lang,
-        ensemble_result, config
+        ensemble_result, thresholds
     )
     
-    logger.warning(f"Final language: {detected_language}, Confidence: {final_confidence:.3f}")
+    logger.debug("Final language: %s, Confidence: %.3f", detected_language, final_confidence)
     
     # Normalize language code
     original_detected_language = detected_language
     normalized_detected_language = normalize_language_code(detected_language, keep_suffixes=True)
     
     if original_detected_language != normalized_detected_language:
-        logger.warning(f"Language code normalized: {original_detected_language} → {normalized_detected_language}")
+        logger.warning("Language code normalized: %s → %s", original_detected_language, normalized_detected_language)
     
     if not detailed:
-        base_code = normalized_detected_language.split('_')[0] if '_' in normalized_detected_language else normalized_detected_language
-        return base_code
+        return normalized_detected_language.partition('_')[0]
     
     return _build_detailed_result(
         normalized_detected_language, final_confidence, detection_method,
         text_length, is_short_text, is_very_short_text,
         composition_analysis, script_lang, script_counts,
         glotlid_lang, glotlid_confidence, glotlid_code_mixed,
-        romanized_lang, romanized_confidence, config,
+        romanized_lang, romanized_confidence, config_report,
         original_language=original_detected_language,
         ensemble_result=ensemble_result
     )
 
 
 def _detect_language_core(text, text_length, is_short_text, is_very_short_text,
-                          composition_analysis, script_lang, script_counts,
+                          indic_percentage, latin_percentage, composition_code_mixed, script_lang,
                           glotlid_lang, glotlid_confidence, glotlid_code_mixed,
                           romanized_lang, romanized_confidence,
                           is_code_mixed_detected, code_mixed_primary_lang,
-                          ensemble_result, config):
+                          ensemble_result, thresholds):
     """Core detection logic - returns (language, method, confidence)"""
     
-    indic_percentage = composition_analysis['composition']['indic_percentage']
-    latin_percentage = composition_analysis['composition']['latin_percentage']
-    
     # Short text handling
     if is_short_text:
         return _detect_short_text(
             text, text_length, is_very_short_text, script_lang, indic_percentage, latin_percentage,
-            glotlid_lang, glotlid_confidence, romanized_lang, romanized_confidence, config
+            glotlid_lang, glotlid_confidence, romanized_lang, romanized_confidence, thresholds
         )
     
+    if ensemble_result:
+        ensemble_language = ensemble_result['final_language']
+        ensemble_method = f"ensemble_{ensemble_result['detection_method']}"
+        ensemble_confidence = ensemble_result['final_confidence']
+    else:
+        ensemble_language, ensemble_method, ensemble_confidence = None, None, 0.0
+    
+    return _decide(
+        text, indic_percentage, latin_percentage, composition_code_mixed, script_lang,
+        glotlid_lang, glotlid_confidence, glotlid_code_mixed,
+        is_code_mixed_detected, code_mixed_primary_lang,
+        ensemble_language, ensemble_method, ensemble_confidence,
+        thresholds
+    )
+
+
+def _decide(text: str, indic_percentage: float, latin_percentage: float, composition_code_mixed: bool,
+            script_lang: Optional[str], glotlid_lang: Optional[str], glotlid_confidence: float,
+            glotlid_code_mixed: bool, is_code_mixed_detected: bool, code_mixed_primary_lang: Optional[str],
+            ensemble_language: Optional[str], ensemble_method: Optional[str], ensemble_confidence: float,
+            thresholds: "_DetectionThresholds") -> Tuple[str, str, float]:
+    """
+    Priority ladder for normal-length text - returns (language, method, confidence)
+    
+    Works only on scalars and a frozen threshold tuple (no config dict
+    lookups). The code-mixing result computed up front by detect_language
+    is reused instead of re-running detect_code_mixing on each rung.
+    """
+    has_glotlid = bool(glotlid_lang)
+    has_known_glotlid = has_glotlid and glotlid_lang != 'unknown'
+    
     # Standard detection logic
-    if ensemble_result and ensemble_result['final_confidence'] >= config.get('ensemble_min_combined_confidence', 0.65):
-        return ensemble_result['final_language'], f"ensemble_{ensemble_result['detection_method']}", ensemble_result['final_confidence']
+    if ensemble_language is not None and ensemble_confidence >= thresholds.ensemble_min_confidence:
+        return ensemble_language, ensemble_method, ensemble_confidence
     
-    if glotlid_lang and glotlid_confidence > 0.95:
+    if has_glotlid and glotlid_confidence > 0.95:
         return glotlid_lang, 'glotlid_high_confidence', glotlid_confidence
     
-    if glotlid_code_mixed and glotlid_lang and glotlid_confidence > config['glotlid_threshold']:
+    if glotlid_code_mixed and has_glotlid and glotlid_confidence > thresholds.glotlid_threshold:
         return f"{glotlid_lang}_mixed", 'glotlid_code_mixed', glotlid_confidence
     
-    if script_lang and indic_percentage > config['strong_script_threshold']:
+    if script_lang and indic_percentage > thresholds.strong_script_threshold:
         return script_lang, 'script_analysis', min(0.95, indic_percentage / 100 + 0.1)
     
-    if glotlid_lang and glotlid_confidence > config['high_confidence_threshold']:
-        if latin_percentage > 70:
-            is_mixed, primary_lang = detect_code_mixing(text)
-            if is_mixed:
-                if primary_lang == 'eng':
-                    return f"{glotlid_lang}_indic_mixed", 'code_mixed_high_confidence', 0.82
-                else:
-                    return f"{primary_lang}_eng_mixed", 'code_mixed_high_confidence', 0.82
+    if has_glotlid and glotlid_confidence > thresholds.high_confidence_threshold:
+        if latin_percentage > 70 and is_code_mixed_detected:
+            if code_mixed_primary_lang == 'eng':
+                return f"{glotlid_lang}_indic_mixed", 'code_mixed_high_confidence', 0.82
+            else:
+                return f"{code_mixed_primary_lang}_eng_mixed", 'code_mixed_high_confidence', 0.82
         return glotlid_lang, 'glotlid', glotlid_confidence
     
-    if script_lang and config['code_mixed_min_threshold'] <= indic_percentage <= config['code_mixed_max_threshold'] and composition_analysis['composition']['is_code_mixed']:
+    if (script_lang and thresholds.code_mixed_min_threshold <= indic_percentage <= thresholds.code_mixed_max_threshold
+            and composition_code_mixed):
         return f"{script_lang}_mixed", 'code_mixed_analysis', min(0.85, indic_percentage / 100 + 0.2)
     
-    if glotlid_lang and glotlid_confidence > config['medium_confidence_threshold']:
-        is_mixed, primary_lang = detect_code_mixing(text)
-        if is_mixed and latin_percentage > 70:
-            if primary_lang == 'eng':
+    if has_glotlid and glotlid_confidence > thresholds.medium_confidence_threshold:
+        if is_code_mixed_detected and latin_percentage > 70:
+            if code_mixed_primary_lang == 'eng':
                 return f"{glotlid_lang}_mixed", 'code_mixed_romanized', 0.80
             else:
-                return f"{primary_lang}_eng_mixed", 'code_mixed_romanized', 0.80
+                return f"{code_mixed_primary_lang}_eng_mixed", 'code_mixed_romanized', 0.80
         
         rom_lang, rom_conf = detect_romanized_indian_language(text)
         if rom_lang and latin_percentage > 70:
@@ -247,37 +607,36 @@ def _detect_language_core(text, text_length, is_short_text, is_very_short_text,
                 return glotlid_lang, 'glotlid_medium_override_romanized', glotlid_confidence
         return glotlid_lang, 'glotlid_medium', glotlid_confidence
     
-    if latin_percentage > config['latin_dominance_threshold']:
+    if latin_percentage > thresholds.latin_dominance_threshold:
         rom_lang, rom_conf = detect_romanized_indian_language(text)
         if rom_lang and rom_conf >= 0.5:
-            if glotlid_lang and glotlid_lang != 'unknown' and glotlid_confidence > rom_conf:
+            if has_known_glotlid and glotlid_confidence > rom_conf:
                 return glotlid_lang, 'glotlid_latin_override_romanized', glotlid_confidence
             return rom_lang, 'romanized_indic_latin', rom_conf
         
-        is_mixed, primary_lang = detect_code_mixing(text)
-        if is_mixed:
-            if primary_lang == 'eng':
+        if is_code_mixed_detected:
+            if code_mixed_primary_lang == 'eng':
                 return 'eng_indic_mixed', 'code_mixed_latin_dominant', 0.75
             else:
-                return f"{primary_lang}_eng_mixed", 'code_mixed_latin_dominant', 0.75
+                return f"{code_mixed_primary_lang}_eng_mixed", 'code_mixed_latin_dominant', 0.75
         
         if rom_lang:
             return rom_lang, 'romanized_indic_latin_low_conf', rom_conf
-        if glotlid_lang and glotlid_lang != 'unknown':
+        if has_known_glotlid:
             return glotlid_lang, 'glotlid_latin', glotlid_confidence
         return 'eng', 'latin_fallback', 0.5
     
-    if glotlid_lang and glotlid_lang != 'unknown':
+    if has_known_glotlid:
         return glotlid_lang, 'glotlid_low', glotlid_confidence
     
-    if script_lang and config['minor_script_min_threshold'] <= indic_percentage < config['minor_script_max_threshold']:
+    if script_lang and thresholds.minor_script_min_threshold <= indic_percentage < thresholds.minor_script_max_threshold:
         return f"{script_lang}_transliterated", 'transliterated', 0.5
     
     return 'unknown', 'no_detection', 0.3
 
 
 def _detect_short_text(text, text_length, is_very_short_text, script_lang, indic_percentage, latin_percentage,
-                       glotlid_lang, glotlid_confidence, romanized_lang, romanized_confidence, config):
+                       glotlid_lang, glotlid_confidence, romanized_lang, romanized_confidence, thresholds):
     """Short text detection logic"""
     
     if is_very_short_text:
@@ -289,11 +648,11 @@ def _detect_short_text(text, text_length, is_very_short_text, script_lang, indic
             return 'unknown', 'very_short_text_insufficient_data', 0.3
     
     # Short text (6-10 chars)
-    if glotlid_lang and glotlid_confidence > config['short_text_glotlid_threshold']:
+    if glotlid_lang and glotlid_confidence > thresholds.short_text_glotlid_threshold:
         return glotlid_lang, 'glotlid_short_text', min(0.80, glotlid_confidence)
-    elif script_lang and indic_percentage > config['short_text_script_threshold']:
+    elif script_lang and indic_percentage > thresholds.short_text_script_threshold:
         return script_lang, 'script_analysis_short_text', min(0.85, indic_percentage / 100 + 0.1)
-    elif romanized_lang and romanized_confidence > config['short_text_romanized_threshold']:
+    elif romanized_lang and romanized_confidence > thresholds.short_text_romanized_threshold:
         return romanized_lang, 'romanized_short_text', romanized_confidence * 0.9
     else:
         if indic_percentage > 0:
@@ -307,10 +666,19 @@ def _detect_short_text(text, text_length, is_very_short_text, script_lang, indic
 def _build_detailed_result(language, confidence, method, text_length, is_short_text, is_very_short_text,
                            composition_analysis, script_lang, script_counts,
                            glotlid_lang, glotlid_confidence, glotlid_code_mixed,
-                           romanized_lang, romanized_confidence, config,
+                           romanized_lang, romanized_confidence, config_report,
                            original_language=None, ensemble_result=None):
     """Build detailed analysis result dictionary"""
     
+    config_version, config_values = config_report
+    base_code = language.partition('_')[0]
+    suffix = language[len(base_code):]  # e.g. '_eng_mixed', '' for plain codes
+    is_indian_language = base_code in _INDIAN_LANGUAGE_SET
+    # '_eng_mixed' contains '_mixed' as well, so one test covers both suffixes
+    has_mixed_suffix = '_mixed' in suffix
+    has_roman_suffix = '_roman' in suffix
+    composition = composition_analysis['composition']
+    
     result = {
         'language': language,
         'confidence': confidence,
@@ -318,7 +686,7 @@ def _build_detailed_result(language, confidence, method, text_length, is_short_t
         'text_length': text_length,
         'is_short_text': is_short_text,
         'is_very_short_text': is_very_short_text,
-        'composition': composition_analysis['composition'],
+        'composition': composition,
         'script_analysis': {
             'detected_script': script_lang,
             'script_counts': script_counts
@@ -333,13 +701,17 @@ def _build_detailed_result(language, confidence, method, text_length, is_short_t
             'confidence': romanized_confidence
         },
         'language_info': {
-            'is_indian_language': language.split('_')[0] in INDIAN_LANGUAGES,
-            'is_international_language': language.split('_')[0] in INTERNATIONAL_LANGUAGES,
-            'is_code_mixed': '_mixed' in language or '_eng_mixed' in language or composition_analysis['composition']['is_code_mixed'],
-            'is_romanized': '_roman' in language or (language.split('_')[0] in INDIAN_LANGUAGES and composition_analysis['composition']['latin_percentage'] > 70),
-            'language_name': get_language_display_name(language)
+            'is_indian_language': is_indian_language,
+            'is_international_language': base_code in _INTERNATIONAL_LANGUAGE_SET,
+            'is_code_mixed': has_mixed_suffix or composition['is_code_mixed'],
+            'is_romanized': has_roman_suffix or (is_indian_language and composition['latin_percentage'] > 70),
+            'language_name': get_language_display_name(base_code)
         },
-        'detection_config': config
+        # Deprecated, removed in 2.1.0: use detection_config_version (or
+        # get_detection_config() for values).
+        # Shared read-only object, not a per-call copy
+        'detection_config': config_values,
+        'detection_config_version': config_version
     }
     
     if original_language:
@@ -367,6 +739,65 @@ def get_language_statistics(text: str) -> Dict:
     return stats
 
 
-def detect_language_simple(text: str) -> str:
-    """Simple language detection for backward compatibility"""
+@log_performance(logger)
+def detect_language_batch(texts: Iterable[str], detailed: bool = False) -> List[Union[str, Dict]]:
+    """
+    Detect languages for many texts, querying GLotLID once for the whole batch
+    
+    Results are identical to calling detect_language on each text; only the
+    model inference is batched, and repeated texts are detected once.
+    Every text is validated before any detection runs, and validation is
+    all-or-nothing: one invalid text (e.g. empty) fails the whole batch.
+    
+    Args:
+        texts (Iterable[str]): Input texts to analyze
+        detailed (bool): If True, returns detailed analysis per text
+        
+    Returns:
+        List[Union[str, Dict]]: One result per input text, in order
+    
+    Raises:
+        ValidationError: If any input fails validation (no results are returned)
+    """
+    texts = list(texts)
+    for text in texts:
+        _validate_detection_text(text)
+    
+    # Duplicate posts (retweets, spam) are common; detect each distinct text once
+    unique_texts = list(dict.fromkeys(texts))
+    
+    # One model call for every text long enough to be sent to GLotLID
+    fast_paths = {text: _fast_path(text) for text in unique_texts}
+    glotlid_texts = [text for text, fast_path in fast_paths.items() if _needs_glotlid(text, fast_path)]
+    glotlid_predictions = dict(zip(glotlid_texts, _glotlid_predict_raw_batch(glotlid_texts, k=3)))
+    
+    results_by_text = {
+        text: _detect_language_impl(text, detailed, fast_path, glotlid_predictions.get(text))
+        for text, fast_path in fast_paths.items()
+    }
+    if not detailed or len(unique_texts) == len(texts):
+        return [results_by_text[text] for text in texts]
+    
+    # Repeats get their own copy of the detailed dict, as separate calls would
+    results = []
+    seen = set()
+    for text in texts:
+        result = results_by_text[text]
+        if text in seen:
+            result = copy.deepcopy(result)
+        seen.add(text)
+        results.append(result)
+    return results
+
+
+def detect_language_simple(text: Union[str, List[str], Tuple[str, ...]]) -> Union[str, List[str]]:
+    """
+    Simple language detection for backward compatibility
+    
+    Accepts a single text or a list/tuple of texts; lists and tuples are
+    routed through detect_language_batch, anything else (including None)
+    through detect_language.
+    """
+    if isinstance(text, (list, tuple)):
+        return detect_language_batch(text, detailed=False)
     return detect_language(text, detailed=False)
\ No newline at end of file
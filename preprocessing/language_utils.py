@@ -5,7 +5,7 @@ This module contains utility functions for language code normalization and displ
 Extracted from preprocessing.py for better modularity.
 """
 
-from typing import Optional
+from typing import Dict, Optional
 
 from logger_config import get_logger
 from .language_constants import (
@@ -17,6 +17,35 @@ from .language_constants import (
 
 logger = get_logger(__name__, level="INFO")
 
+# Suffixes the detectors append to a base language code
+_DETECTION_SUFFIXES = ('', '_mixed', '_eng_mixed', '_indic_mixed', '_roman', '_transliterated')
+
+
+def _build_canonical_suffix_lut() -> Dict[str, str]:
+    """
+    Precompute normalize_language_code(code, keep_suffixes=True) for the codes
+    detection emits that are already canonical (output == lowercased input)
+    
+    Codes that get remapped are left out so their normalization is still logged.
+    """
+    lut = {}
+    for base_code in (*INDIAN_LANGUAGES, *INTERNATIONAL_LANGUAGES, 'unknown'):
+        if base_code.lower() in LANGUAGE_CODE_NORMALIZATION:
+            continue
+        for suffix in _DETECTION_SUFFIXES:
+            lut[base_code + suffix] = base_code.lower() + suffix
+    return lut
+
+
+_CANONICAL_SUFFIX_LUT = _build_canonical_suffix_lut()
+
+# Display names for the same already-canonical codes; normalizing them never
+# remaps (and so never logs), leaving only the CANONICAL_LANGUAGE_NAMES lookup
+_DISPLAY_NAME_LUT = {
+    code: CANONICAL_LANGUAGE_NAMES.get(canonical.partition('_')[0], 'Unknown')
+    for code, canonical in _CANONICAL_SUFFIX_LUT.items()
+}
+
 
 def normalize_language_code(lang_code: str, keep_suffixes: bool = False) -> str:
     """
@@ -45,14 +74,15 @@ def normalize_language_code(lang_code: str, keep_suffixes: bool = False) -> str:
     if not lang_code:
         return 'unknown'
     
-    # Split into base code and suffix (e.g., 'hin_mixed' -> 'hin', '_mixed')
-    base_code = lang_code
-    suffix = ''
+    # Fast path for the common already-canonical detection results
+    if keep_suffixes:
+        canonical = _CANONICAL_SUFFIX_LUT.get(lang_code)
+        if canonical is not None:
+            return canonical
     
-    if '_' in lang_code:
-        parts = lang_code.split('_', 1)
-        base_code = parts[0]
-        suffix = '_' + parts[1] if keep_suffixes else ''
+    # Split into base code and suffix (e.g., 'hin_mixed' -> 'hin', '_mixed')
+    base_code, sep, rest = lang_code.partition('_')
+    suffix = sep + rest if keep_suffixes else ''
     
     # Convert to lowercase for case-insensitive matching
     base_code_lower = base_code.lower()
@@ -60,7 +90,7 @@ def normalize_language_code(lang_code: str, keep_suffixes: bool = False) -> str:
     # Check if normalization is needed
     if base_code_lower in LANGUAGE_CODE_NORMALIZATION:
         normalized = LANGUAGE_CODE_NORMALIZATION[base_code_lower]
-        logger.info(f"[Language Code Normalization] {base_code} → {normalized}{suffix}")
+        logger.info("[Language Code Normalization] %s → %s%s", base_code, normalized, suffix)
         return normalized + suffix
     
     # Already canonical or not in mapping - return as is
@@ -77,11 +107,15 @@ def get_language_display_name(lang_code: str) -> str:
     Returns:
         str: Display name (e.g., 'Hindi', 'Marathi', 'Unknown')
     """
+    display_name = _DISPLAY_NAME_LUT.get(lang_code)
+    if display_name is not None:
+        return display_name
+    
     # Normalize first
     normalized = normalize_language_code(lang_code, keep_suffixes=False)
     
     # Get base code without suffixes
-    base_code = normalized.split('_')[0]
+    base_code = normalized.partition('_')[0]
     
     return CANONICAL_LANGUAGE_NAMES.get(base_code, 'Unknown')
 
@@ -111,7 +111,7 @@ class CharacterNgramDetector:
             self.language_total_ngrams[language] = total
         
         self._initialized = True
-        logger.info(f"N-gram detector initialized with {len(self.language_profiles)} languages")
+        logger.info("N-gram detector initialized with %s languages", len(self.language_profiles))
     
     def _calculate_similarity(self, text_ngrams: Counter, language: str) -> float:
         """Calculate similarity score"""
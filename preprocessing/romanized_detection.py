@@ -9,6 +9,7 @@ Extracted from preprocessing.py for better modularity.
 import sys
 import os
 import re
+from functools import lru_cache
 from typing import Dict, List, Tuple, Optional, Union
 
 from logger_config import get_logger
@@ -29,6 +30,30 @@ sys.path.append(os.path.join(BASE_PATH, "indic_nlp_library"))
 from indicnlp.transliterate import unicode_transliterate as indic_transliterate
 from indicnlp import common as indic_common
 
+# Romanized marker patterns compiled once instead of per call
+_COMPILED_ROMANIZED_PATTERNS = {
+    lang: tuple(re.compile(pattern, re.IGNORECASE) for pattern in patterns)
+    for lang, patterns in ROMANIZED_INDIAN_PATTERNS.items()
+}
+
+# English words that stay English even when they also appear in the romanized dictionary
+_VERY_COMMON_ENGLISH_WORDS = frozenset({
+    'the', 'to', 'of', 'and', 'a', 'in', 'is', 'it', 'you', 'that',
+    'he', 'was', 'for', 'on', 'are', 'with', 'as', 'I', 'his', 'they',
+    'be', 'at', 'one', 'have', 'this', 'from', 'or', 'had', 'by', 'not',
+    'but', 'what', 'all', 'were', 'we', 'when', 'your', 'can', 'said',
+    'if', 'do', 'will', 'each', 'about', 'how', 'up', 'out', 'them',
+    'my', 'so', 'am', 'going', 'today', 'tomorrow', 'yesterday',
+    'morning', 'evening', 'night', 'time', 'day', 'week', 'month', 'year'
+})
+
+# ENGLISH_PATTERNS['suffixes'] anchored at the token start only matches when the
+# token's leading \w+ run ends in a suffix with at least one character before it
+_ENGLISH_SUFFIXES = tuple(
+    re.search(r'\((\w+(?:\|\w+)*)\)', ENGLISH_PATTERNS['suffixes'].pattern).group(1).split('|')
+)
+_LEADING_WORD_RE = re.compile(r'\w+')
+
 # Flag to track if transliteration library is initialized
 _transliterate_initialized = False
 
@@ -43,18 +68,38 @@ def _ensure_transliterate_initialized():
         # Initialize the transliteration library
         indic_transliterate.init()
         _transliterate_initialized = True
-        logger.info(f"Initialized indic_nlp transliteration with resources at: {indic_resources_path}")
+        logger.info("Initialized indic_nlp transliteration with resources at: %s", indic_resources_path)
+
+
+# Memoization of repeated posts; long texts are rarely repeated verbatim
+_ROMANIZED_CACHE_SIZE = 4096
+_ROMANIZED_CACHE_MAX_TEXT_LENGTH = 512
 
 
 def detect_romanized_indian_language(text: str) -> Tuple[Optional[str], float]:
     """
     Detect if Latin-script text is romanized Indian language
     
+    Results for texts up to 512 characters are memoized: detect_language may
+    consult this up to three times for the same input, and repeated posts
+    are common.
+    
     Returns:
         Tuple[Optional[str], float]: (detected_language, confidence_score)
             - detected_language: Language code ('hin', 'mar', 'tam', etc.) or None
             - confidence_score: Float between 0.0 and 1.0 based on pattern matches
     """
+    if not text or len(text) > _ROMANIZED_CACHE_MAX_TEXT_LENGTH:
+        return _detect_romanized_indian_language_impl(text)
+    return _detect_romanized_indian_language_cached(text)
+
+
+@lru_cache(maxsize=_ROMANIZED_CACHE_SIZE)
+def _detect_romanized_indian_language_cached(text: str) -> Tuple[Optional[str], float]:
+    return _detect_romanized_indian_language_impl(text)
+
+
+def _detect_romanized_indian_language_impl(text: str) -> Tuple[Optional[str], float]:
     if not text or len(text.strip()) < 3:
         return None, 0.0
     
@@ -66,14 +111,10 @@ def detect_romanized_indian_language(text: str) -> Tuple[Optional[str], float]:
         return None, 0.0
     
     language_scores = {'marathi': 0, 'hindi': 0, 'tamil': 0, 'generic_indic': 0}
-    matched_words = {'marathi': [], 'hindi': [], 'tamil': [], 'generic_indic': []}
     
-    for lang, patterns in ROMANIZED_INDIAN_PATTERNS.items():
+    for lang, patterns in _COMPILED_ROMANIZED_PATTERNS.items():
         for pattern in patterns:
-            matches = re.findall(pattern, text_lower, re.IGNORECASE)
-            if matches:
-                language_scores[lang] += len(matches)
-                matched_words[lang].extend(matches)
+            language_scores[lang] += len(pattern.findall(text_lower))
     
     # Calculate confidence scores for each language
     total_marathi_matches = language_scores['marathi'] + (language_scores['generic_indic'] * 0.5)
@@ -140,12 +181,14 @@ def detect_romanized_indian_language(text: str) -> Tuple[Optional[str], float]:
     
     # FIX #5: Diagnostic logging for pattern-based romanized detection
     if detected_lang:
-        logger.debug(f"[Romanized Pattern] Detected: {detected_lang}, Confidence: {final_confidence:.3f}, "
-                    f"Marathi matches: {language_scores['marathi']}, Hindi matches: {language_scores['hindi']}, "
-                    f"Tamil matches: {language_scores['tamil']}, "
-                    f"Generic matches: {language_scores['generic_indic']}, Total words: {total_words}")
+        logger.debug("[Romanized Pattern] Detected: %s, Confidence: %.3f, "
+                    "Marathi matches: %s, Hindi matches: %s, "
+                    "Tamil matches: %s, "
+                    "Generic matches: %s, Total words: %s",
+                    detected_lang, final_confidence, language_scores['marathi'], language_scores['hindi'],
+                    language_scores['tamil'], language_scores['generic_indic'], total_words)
     else:
-        logger.debug(f"[Romanized Pattern] No romanized language detected (Total words: {total_words})")
+        logger.debug("[Romanized Pattern] No romanized language detected (Total words: %s)", total_words)
     
     return detected_lang, final_confidence
 
@@ -194,14 +237,16 @@ def detect_romanized_with_indic_nlp(text: str) -> Tuple[Optional[str], float]:
             pattern_lang, pattern_confidence = detect_romanized_indian_language(text)
             
             # FIX #5: Diagnostic logging for ITRANS detection
-            logger.debug(f"[ITRANS Transliteration] Hindi ratio: {hindi_ratio:.3f}, Marathi ratio: {marathi_ratio:.3f}, "
-                        f"Threshold: {threshold:.2f}, Pattern lang: {pattern_lang}, Pattern confidence: {pattern_confidence:.3f}")
+            logger.debug("[ITRANS Transliteration] Hindi ratio: %.3f, Marathi ratio: %.3f, "
+                        "Threshold: %.2f, Pattern lang: %s, Pattern confidence: %.3f",
+                        hindi_ratio, marathi_ratio, threshold, pattern_lang, pattern_confidence)
             
             if pattern_lang:
                 # Combine transliteration and pattern confidence
                 combined_confidence = (max_ratio * 0.6) + (pattern_confidence * 0.4)
-                logger.debug(f"[ITRANS Combined] Lang: {pattern_lang}, Combined confidence: {combined_confidence:.3f} "
-                           f"(transliteration: {max_ratio:.3f} * 0.6 + pattern: {pattern_confidence:.3f} * 0.4)")
+                logger.debug("[ITRANS Combined] Lang: %s, Combined confidence: %.3f "
+                           "(transliteration: %.3f * 0.6 + pattern: %.3f * 0.4)",
+                           pattern_lang, combined_confidence, max_ratio, pattern_confidence)
                 return pattern_lang, min(0.95, combined_confidence)
             elif marathi_ratio > hindi_ratio:
                 # Pure transliteration-based confidence
@@ -216,7 +261,7 @@ def detect_romanized_with_indic_nlp(text: str) -> Tuple[Optional[str], float]:
         return detect_romanized_indian_language(text)
         
     except Exception as e:
-        logger.debug(f"Error in indic_nlp transliteration: {e}, falling back to pattern matching")
+        logger.debug("Error in indic_nlp transliteration: %s, falling back to pattern matching", e)
         return detect_romanized_indian_language(text)
 
 
@@ -252,15 +297,31 @@ def detect_romanized_language(text: str, use_enhanced: bool = None) -> Tuple[Opt
             if ngram_lang and ngram_conf > 0.4:
                 # Use n-gram if it has better confidence
                 if detected_lang is None or ngram_conf > confidence:
-                    logger.debug(f"[N-gram Fallback] Using n-gram: {ngram_lang} ({ngram_conf:.3f}) "
-                               f"vs pattern: {detected_lang} ({confidence:.3f})")
+                    logger.debug("[N-gram Fallback] Using n-gram: %s (%.3f) "
+                               "vs pattern: %s (%.3f)",
+                               ngram_lang, ngram_conf, detected_lang, confidence)
                     return ngram_lang, ngram_conf
         except Exception as e:
-            logger.debug(f"N-gram fallback failed: {e}")
+            logger.debug("N-gram fallback failed: %s", e)
     
     return detected_lang, confidence
 
 
+def _has_english_suffix(token: str) -> bool:
+    """Same result as ENGLISH_PATTERNS['suffixes'].match(token), without regex backtracking"""
+    if not token.isascii():
+        # Case-insensitive matching treats some non-ASCII letters as s/k; keep the regex
+        return ENGLISH_PATTERNS['suffixes'].match(token) is not None
+    if token.isalnum():
+        leading_word = token
+    else:
+        match = _LEADING_WORD_RE.match(token)
+        if match is None:
+            return False
+        leading_word = match.group()
+    return leading_word[1:].lower().endswith(_ENGLISH_SUFFIXES)
+
+
 def is_english_token(token: str, romanized_dict: Optional[set] = None) -> bool:
     """
     FIX #10: Determine if a token is likely an English word
@@ -302,28 +363,21 @@ def is_english_token(token: str, romanized_dict: Optional[set] = None) -> bool:
         # But common English words have priority
         if romanized_dict and clean_token in romanized_dict:
             # Very common English words override romanized dict
-            very_common = {'the', 'to', 'of', 'and', 'a', 'in', 'is', 'it', 'you', 'that', 
-                          'he', 'was', 'for', 'on', 'are', 'with', 'as', 'I', 'his', 'they',
-                          'be', 'at', 'one', 'have', 'this', 'from', 'or', 'had', 'by', 'not',
-                          'but', 'what', 'all', 'were', 'we', 'when', 'your', 'can', 'said',
-                          'if', 'do', 'will', 'each', 'about', 'how', 'up', 'out', 'them',
-                          'my', 'so', 'am', 'going', 'today', 'tomorrow', 'yesterday',
-                          'morning', 'evening', 'night', 'time', 'day', 'week', 'month', 'year'}
-            if clean_token in very_common:
+            if clean_token in _VERY_COMMON_ENGLISH_WORDS:
                 return True
             return False  # Ambiguous - prefer Indic
         return True
     
-    # 2. Check for English contractions
-    if ENGLISH_PATTERNS['contractions'].match(clean_token):
+    # 2. Check for English contractions (every listed contraction has an apostrophe)
+    if "'" in clean_token and ENGLISH_PATTERNS['contractions'].match(clean_token):
         return True
     
-    # 3. Check for ALL CAPS (likely acronym or emphasis)
-    if ENGLISH_PATTERNS['all_caps'].match(token):
+    # 3. Check for ALL CAPS (likely acronym or emphasis; a match needs token[:2] uppercase)
+    if token[:2].isupper() and ENGLISH_PATTERNS['all_caps'].match(token):
         return True
     
     # 4. Check for English suffixes
-    if ENGLISH_PATTERNS['suffixes'].match(clean_token) and len(clean_token) > 5:
+    if len(clean_token) > 5 and _has_english_suffix(clean_token):
         # Longer words with English suffixes are likely English
         # But cross-check with romanized dict
         if romanized_dict and clean_token in romanized_dict:
@@ -446,7 +500,7 @@ def convert_romanized_to_native(text: str, lang_code: str, preserve_english: boo
                 'status': 'preserved_english',
                 'method': 'none'
             })
-            logger.debug(f"[FIX #10 Hybrid] Token '{token}' identified as English - preserved")
+            logger.debug("[FIX #10 Hybrid] Token '%s' identified as English - preserved", token)
         else:
             # Try to convert to native script
             conversion_success = False
@@ -460,7 +514,8 @@ def convert_romanized_to_native(text: str, lang_code: str, preserve_english: boo
                     converted_word = ROMANIZED_DICTIONARY[lang_key][clean_token]
                     conversion_success = True
                     conversion_method = 'dictionary'
-                    logger.debug(f"[FIX #10 Hybrid] Token '{clean_token}' converted via dictionary: '{converted_word}'")
+                    logger.debug("[FIX #10 Hybrid] Token '%s' converted via dictionary: '%s'",
+                                 clean_token, converted_word)
                 except:
                     pass
             
@@ -481,9 +536,10 @@ def convert_romanized_to_native(text: str, lang_code: str, preserve_english: boo
                             converted_word = itrans_result
                             conversion_success = True
                             conversion_method = 'itrans'
-                            logger.debug(f"[FIX #10 Hybrid] Token '{clean_token}' converted via ITRANS: '{converted_word}'")
+                            logger.debug("[FIX #10 Hybrid] Token '%s' converted via ITRANS: '%s'",
+                                         clean_token, converted_word)
                 except Exception as e:
-                    logger.debug(f"[FIX #10 Hybrid] ITRANS conversion failed for '{clean_token}': {e}")
+                    logger.debug("[FIX #10 Hybrid] ITRANS conversion failed for '%s': %s", clean_token, e)
             
             # Add back punctuation
             final_token = prefix_punct + converted_word + suffix_punct
@@ -505,7 +561,7 @@ def convert_romanized_to_native(text: str, lang_code: str, preserve_english: boo
                     'status': 'failed',
                     'method': 'none'
                 })
-                logger.debug(f"[FIX #10 Hybrid] Token '{token}' could not be converted - kept as-is")
+                logger.debug("[FIX #10 Hybrid] Token '%s' could not be converted - kept as-is", token)
     
     # Join converted tokens
     converted_text = ' '.join(converted_tokens)
@@ -535,8 +591,8 @@ def convert_romanized_to_native(text: str, lang_code: str, preserve_english: boo
         'token_details': token_details
     }
     
-    logger.info(f"[FIX #10] Hybrid conversion: {converted_count}/{total_tokens} tokens converted, "
-               f"{preserved_count} preserved (English), {failed_count} failed, "
-               f"method={overall_method}, rate={conversion_rate:.1f}%")
+    logger.debug("[FIX #10] Hybrid conversion: %s/%s tokens converted, "
+                 "%s preserved (English), %s failed, method=%s, rate=%.1f%%",
+                 converted_count, total_tokens, preserved_count, failed_count, overall_method, conversion_rate)
     
     return result
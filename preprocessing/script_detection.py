@@ -21,6 +21,94 @@ sys.path.append(os.path.join(BASE_PATH, "indic_nlp_library"))
 
 from indicnlp import langinfo
 
+# Character classes counted by analyze_text_composition
+_LATIN_RANGES = ((65, 90), (97, 122))  # A-Z, a-z
+_NUMERIC_RANGES = ((48, 57),)  # 0-9
+_PUNCTUATION_RANGES = tuple((ord(c), ord(c)) for c in '.,!?;:')
+_SCRIPT_LANGS = tuple(langinfo.SCRIPT_RANGES.keys())
+
+
+def _build_classification_tables() -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Build the lookup tables used by _classify_codepoints
+    
+    Every range boundary becomes a breakpoint, so each code point falls into
+    exactly one elementary interval and a single searchsorted + bincount pass
+    counts all classes at once. Overlapping script ranges (hi/mr/sa/... all
+    share Devanagari) are handled naturally because each class just sums
+    the intervals it covers.
+    
+    Returns:
+        Tuple[np.ndarray, np.ndarray]: (breakpoints, class_matrix) where
+        class_matrix rows are [latin, numeric, punctuation, indic, *languages]
+    """
+    script_ranges = [tuple(r) for r in langinfo.SCRIPT_RANGES.values()]
+    all_ranges = list(_LATIN_RANGES) + list(_NUMERIC_RANGES) + list(_PUNCTUATION_RANGES) + script_ranges
+    breakpoints = np.array(sorted({b for lo, hi in all_ranges for b in (lo, hi + 1)}), dtype=np.uint32)
+    
+    def interval_row(ranges):
+        row = np.zeros(len(breakpoints) + 1, dtype=np.int64)
+        for lo, hi in ranges:
+            start = np.searchsorted(breakpoints, lo, side='right')
+            stop = np.searchsorted(breakpoints, hi, side='right') + 1
+            row[start:stop] = 1
+        return row
+    
+    rows = [
+        interval_row(_LATIN_RANGES),
+        interval_row(_NUMERIC_RANGES),
+        interval_row(_PUNCTUATION_RANGES),
+        interval_row(script_ranges),
+    ]
+    rows.extend(interval_row([tuple(langinfo.SCRIPT_RANGES[lang])]) for lang in _SCRIPT_LANGS)
+    return breakpoints, np.vstack(rows)
+
+
+_BREAKPOINTS, _CLASS_MATRIX = _build_classification_tables()
+
+# Byte sets for the ASCII fast path (pure-ASCII text has no Indic characters)
+_ASCII_LATIN_BYTES = bytes(c for lo, hi in _LATIN_RANGES for c in range(lo, hi + 1))
+_ASCII_NUMERIC_BYTES = bytes(c for lo, hi in _NUMERIC_RANGES for c in range(lo, hi + 1))
+_ASCII_PUNCTUATION_BYTES = bytes(lo for lo, _ in _PUNCTUATION_RANGES)
+
+
+def _count_ascii_classes(text: str) -> Tuple[int, int, int]:
+    """
+    Count latin, numeric and punctuation characters of a pure-ASCII text
+    
+    bytes.translate with a delete set runs in C, so each class costs one
+    linear byte scan instead of building a code point array.
+    """
+    data = text.encode('ascii')
+    total = len(data)
+    return (
+        total - len(data.translate(None, _ASCII_LATIN_BYTES)),
+        total - len(data.translate(None, _ASCII_NUMERIC_BYTES)),
+        total - len(data.translate(None, _ASCII_PUNCTUATION_BYTES)),
+    )
+
+
+def _codepoint_array(text: str) -> np.ndarray:
+    """Zero-copy view of the text's code points (no per-character Python loop)"""
+    return np.frombuffer(text.encode('utf-32-le', 'surrogatepass'), dtype=np.uint32)
+
+
+def _classify_codepoints(char_codes: np.ndarray) -> np.ndarray:
+    """
+    Count character classes in one vectorized pass
+    
+    Returns:
+        np.ndarray: counts ordered as [latin, numeric, punctuation, indic, *languages]
+    """
+    intervals = np.searchsorted(_BREAKPOINTS, char_codes, side='right')
+    interval_counts = np.bincount(intervals, minlength=len(_BREAKPOINTS) + 1)
+    return _CLASS_MATRIX @ interval_counts
+
+
+def _script_counts_from_classes(class_counts: np.ndarray) -> Dict[str, int]:
+    """Map per-language counts back to a {lang_code: count} dict (non-zero only)"""
+    return {lang: int(count) for lang, count in zip(_SCRIPT_LANGS, class_counts[4:].tolist()) if count > 0}
+
 
 def detect_script_based_language(text: str) -> Tuple[Optional[str], Dict[str, int]]:
     """
@@ -33,26 +121,14 @@ def detect_script_based_language(text: str) -> Tuple[Optional[str], Dict[str, in
     Returns:
         Tuple[Optional[str], Dict[str, int]]: (detected_language, script_counts)
     """
-    if not text:
+    if not text or text.isascii():
         return None, {}
     
-    # Convert text to numpy array of code points (vectorized)
-    char_codes = np.array([ord(c) for c in text], dtype=np.int32)
-    
-    script_counts = {}
-    total_indic_chars = 0
+    # Classify all code points in a single vectorized pass
+    class_counts = _classify_codepoints(_codepoint_array(text))
+    script_counts = _script_counts_from_classes(class_counts)
     
-    # Vectorized script detection - check all characters at once
-    for lang_code, script_range in langinfo.SCRIPT_RANGES.items():
-        # Vectorized comparison (much faster than loop)
-        in_range = (char_codes >= script_range[0]) & (char_codes <= script_range[1])
-        count = np.sum(in_range)
-        
-        if count > 0:
-            script_counts[lang_code] = int(count)
-            total_indic_chars += count
-    
-    if script_counts and total_indic_chars > 0:
+    if script_counts:
         # Return the script with highest count
         detected_lang = max(script_counts, key=script_counts.get)
         return detected_lang, script_counts
@@ -75,35 +151,18 @@ def analyze_text_composition(text: str) -> Dict[str, any]:
     if total_chars == 0:
         return {'total_chars': 0, 'composition': {}}
     
-    # Convert text to numpy array of code points (vectorized - single pass)
-    char_codes = np.array([ord(c) for c in text], dtype=np.int32)
-    
-    # Vectorized character type detection
-    # ASCII letters (a-z, A-Z)
-    latin_mask = (char_codes >= 65) & (char_codes <= 90) | (char_codes >= 97) & (char_codes <= 122)
-    latin_chars = int(np.sum(latin_mask))
-    
-    # Digits (0-9)
-    numeric_mask = (char_codes >= 48) & (char_codes <= 57)
-    numeric_chars = int(np.sum(numeric_mask))
-    
-    # Common punctuation
-    punctuation_codes = np.array([ord(c) for c in '.,!?;:'], dtype=np.int32)
-    punctuation_chars = int(np.sum(np.isin(char_codes, punctuation_codes)))
-    
-    # Script-specific counters (vectorized)
-    script_counts = {}
-    indic_mask = np.zeros(len(char_codes), dtype=bool)  # Track indic chars to avoid double counting
-    
-    for lang_code, script_range in langinfo.SCRIPT_RANGES.items():
-        in_range = (char_codes >= script_range[0]) & (char_codes <= script_range[1])
-        count = int(np.sum(in_range))
+    if text.isascii():
+        # Fast path: most posts are plain ASCII English/Hinglish
+        latin_chars, numeric_chars, punctuation_chars = _count_ascii_classes(text)
+        indic_chars = 0
+        script_counts = {}
+    else:
+        # Classify all code points in a single vectorized pass
+        class_counts = _classify_codepoints(_codepoint_array(text))
+        latin_chars, numeric_chars, punctuation_chars, indic_chars = class_counts[:4].tolist()
         
-        if count > 0:
-            script_counts[lang_code] = count
-            indic_mask |= in_range  # Mark these characters as indic (OR operation avoids double counting)
-    
-    indic_chars = int(np.sum(indic_mask))  # Count unique indic characters only once
+        # Script-specific counters (indic_chars counts shared blocks only once)
+        script_counts = _script_counts_from_classes(class_counts)
     
     # Other chars (total - sum of categorized)
     other_chars = total_chars - (indic_chars + latin_chars + numeric_chars + punctuation_chars)
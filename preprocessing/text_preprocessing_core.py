@@ -17,7 +17,8 @@ from .language_constants import (
     URL_PATTERN,
     HTML_ENTITY_PATTERN,
     WHITESPACE_PATTERN,
-    NON_ESSENTIAL_PUNCT_PATTERN
+    NON_ESSENTIAL_PUNCT_PATTERN,
+    MINIMAL_PUNCT_PATTERN
 )
 
 logger = get_logger(__name__, level="INFO")
@@ -45,7 +46,8 @@ def preprocess_text(text: str, preserve_emojis: bool = True, normalization_level
     Raises:
         ValidationError: If input validation fails
     """
-    logger.debug(f"Preprocessing text (length={len(text)}, emoji={preserve_emojis}, normalize={normalization_level})")
+    logger.debug("Preprocessing text (length=%s, emoji=%s, normalize=%s)",
+                 len(text), preserve_emojis, normalization_level)
     if not text:
         return ""
     
@@ -63,12 +65,19 @@ def preprocess_text(text: str, preserve_emojis: bool = True, normalization_level
     text = text.lower()
     
     # Step 4: Remove social media artifacts (using compiled patterns - much faster)
-    text = MENTION_PATTERN.sub('', text)  # Remove mentions
-    text = HASHTAG_PATTERN.sub(r'\1', text)  # Remove hashtag symbol but keep text
-    text = URL_PATTERN.sub('', text)  # Remove URLs
+    # The passes run in order because each can join text the next one matches
+    # (e.g. '&abc#def;' only becomes an entity once the hashtag '#' is gone);
+    # a pass is skipped when the text cannot contain a match for it
+    if '@' in text:
+        text = MENTION_PATTERN.sub('', text)  # Remove mentions
+    if '#' in text:
+        text = HASHTAG_PATTERN.sub(r'\1', text)  # Remove hashtag symbol but keep text
+    if 'http' in text or 'www.' in text:
+        text = URL_PATTERN.sub('', text)  # Remove URLs
     
     # Step 5: Remove HTML entities
-    text = HTML_ENTITY_PATTERN.sub('', text)
+    if '&' in text:
+        text = HTML_ENTITY_PATTERN.sub('', text)
     
     # Step 6: Clean excessive whitespace
     text = WHITESPACE_PATTERN.sub(' ', text).strip()
@@ -79,8 +88,7 @@ def preprocess_text(text: str, preserve_emojis: bool = True, normalization_level
         text = NON_ESSENTIAL_PUNCT_PATTERN.sub('', text)
     elif punctuation_mode == 'minimal':
         # Remove only redundant/decorative punctuation
-        import re
-        text = re.sub(r'[`"\'\[\]{}\\]', '', text)  # Remove quotes, brackets, backslashes
+        text = MINIMAL_PUNCT_PATTERN.sub('', text)  # Remove quotes, brackets, backslashes
     # else: 'preserve' mode - keep all punctuation
     
     return text.strip()
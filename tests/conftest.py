@@ -0,0 +1,22 @@
+import pytest
+
+from preprocessing import glotlid_detection, language_detection, get_detection_config, update_detection_config
+from .glotlid_stub import StubFastText, stub_glotlid
+
+
+@pytest.fixture
+def stub_model(monkeypatch, tmp_path):
+    """Serve GLotLID from a StubFastText, with an empty detection cache"""
+    stub = StubFastText()
+    monkeypatch.setattr(glotlid_detection, '_glotlid_model', stub_glotlid(monkeypatch, tmp_path, stub))
+    language_detection._detect_cached.cache_clear()
+    yield stub
+    language_detection._detect_cached.cache_clear()
+
+
+@pytest.fixture
+def restore_detection_config():
+    """Undo any update_detection_config calls made by the test"""
+    saved = get_detection_config()
+    yield
+    update_detection_config(**saved)
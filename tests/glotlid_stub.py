@@ -0,0 +1,43 @@
+"""Stub GLotLID model shared by the language detection tests"""
+
+import hashlib
+import random
+
+import numpy as np
+
+import glotlid_wrapper
+from glotlid_wrapper import GLotLID
+
+LABEL_POOL = ['eng_Latn', 'hin_Latn', 'hin_Deva', 'mar_Deva', 'ben_Beng', 'spa_Latn', 'tam_Taml', 'mar_Latn']
+
+
+class StubFastText:
+    """Deterministic stand-in for the fasttext model; records every text it predicts"""
+
+    def __init__(self, fail_on_list=False):
+        self.fail_on_list = fail_on_list
+        self.predicted_texts = []
+
+    def _predict_one(self, text, k):
+        self.predicted_texts.append(text)
+        rng = random.Random(int(hashlib.md5(text.encode('utf-8')).hexdigest(), 16))
+        labels = tuple('__label__' + label for label in rng.sample(LABEL_POOL, k))
+        top = rng.choice([0.97, 0.88, 0.75, 0.55, 0.35])
+        rest = sorted((rng.random() * (1 - top) for _ in range(k - 1)), reverse=True)
+        return labels, np.array([top, *rest])
+
+    def predict(self, text, k=1, threshold=0.0):
+        if isinstance(text, list):
+            if self.fail_on_list:
+                raise ValueError("Unable to avoid copy while creating an array as requested.")
+            predictions = [self._predict_one(item, k) for item in text]
+            return [labels for labels, _ in predictions], [probs for _, probs in predictions]
+        return self._predict_one(text, k)
+
+
+def stub_glotlid(monkeypatch, tmp_path, stub):
+    """GLotLID wrapper around stub, loaded through the real constructor"""
+    model_path = tmp_path / "model.bin"
+    model_path.write_bytes(b"")
+    monkeypatch.setattr(glotlid_wrapper.fasttext, 'load_model', lambda path: stub)
+    return GLotLID(str(model_path))
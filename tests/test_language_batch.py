@@ -0,0 +1,87 @@
+"""Tests for the batched language detection entry points
+
+Runs against a stub GLotLID model, so no model download or API server is needed.
+"""
+
+import numpy as np
+import pytest
+
+from preprocessing import language_detection
+from preprocessing import detect_language, detect_language_batch, detect_code_mixing, detect_code_mixing_batch
+from preprocessing.language_detection import detect_language_simple
+from validators import ValidationError
+from .glotlid_stub import StubFastText, stub_glotlid
+
+TEXTS = [
+    "This is amazing!",
+    "Yeh bahut acha hai yaar",
+    "मी घरी जातो आहे",
+    "आज weather बहुत अच्छा है bro",
+    "kal movie dekhne chalte hai, it will be fun",
+    "আমি ভালো আছি",
+    "Esto es terrible",
+    "ok",
+    ":-)",
+    "This is amazing!",
+    "Yeh bahut acha hai yaar",
+]
+
+
+@pytest.mark.parametrize("detailed", [False, True])
+def test_batch_matches_single_calls(stub_model, detailed):
+    """detect_language_batch returns exactly what per-text detect_language calls return"""
+    batch_results = detect_language_batch(TEXTS, detailed=detailed)
+    language_detection._detect_cached.cache_clear()
+    single_results = [detect_language(text, detailed=detailed) for text in TEXTS]
+
+    assert batch_results == single_results
+
+
+def test_batch_predicts_duplicates_once(stub_model):
+    """Repeated texts reach the model once, in a single batched call"""
+    detect_language_batch(TEXTS)
+
+    assert len(stub_model.predicted_texts) == len(set(stub_model.predicted_texts))
+    assert len(stub_model.predicted_texts) < len(TEXTS)
+
+
+def test_batch_detailed_repeats_are_independent(stub_model):
+    """Each repeated text gets its own detailed dict"""
+    first, *_, repeat = detect_language_batch(["This is amazing!", "ok", "This is amazing!"], detailed=True)
+    first['language'] = 'changed'
+
+    assert repeat['language'] != 'changed'
+
+
+def test_batch_rejects_invalid_item(stub_model):
+    """Validation is all-or-nothing: one invalid text fails the whole batch"""
+    with pytest.raises(ValidationError):
+        detect_language_batch(["This is amazing!", ""])
+    assert stub_model.predicted_texts == []
+
+
+def test_simple_routes_only_sequences_to_batch(stub_model):
+    """Lists and tuples are batched; None and single strings go through detect_language"""
+    assert detect_language_simple(["This is amazing!", "ok"]) == detect_language_batch(["This is amazing!", "ok"])
+    assert detect_language_simple(("ok",)) == detect_language_batch(["ok"])
+    assert detect_language_simple("ok") == detect_language("ok")
+    assert detect_language_simple(None) == 'unknown'
+
+
+@pytest.mark.parametrize("detailed", [False, True])
+def test_code_mixing_batch_matches_single_calls(detailed):
+    assert detect_code_mixing_batch(TEXTS, detailed=detailed) == [
+        detect_code_mixing(text, detailed=detailed) for text in TEXTS
+    ]
+
+
+def test_predict_batch_falls_back_per_text(monkeypatch, tmp_path):
+    """The NumPy 2.x ValueError on list input falls back to per-text predict"""
+    model = stub_glotlid(monkeypatch, tmp_path, StubFastText(fail_on_list=True))
+    expected = stub_glotlid(monkeypatch, tmp_path, StubFastText())
+
+    batch = model.predict_batch(["hello  world", "yeh\nacha hai"], k=3)
+    single = [expected.predict(text, k=3) for text in ["hello  world", "yeh\nacha hai"]]
+
+    assert [labels for labels, _ in batch] == [labels for labels, _ in single]
+    assert all(np.array_equal(got, want) for (_, got), (_, want) in zip(batch, single))
@@ -0,0 +1,66 @@
+"""Tests for single-text detect_language calls and its result cache
+
+The cache tests run against a stub GLotLID model (see glotlid_stub.py).
+"""
+
+import copy
+import json
+
+import pytest
+
+from preprocessing import DETECTION_CONFIG, detect_language, get_detection_config, update_detection_config
+
+
+def test_none_text_is_unknown():
+    """None skips validation and is reported like empty text, not a TypeError"""
+    assert detect_language(None) == 'unknown'
+    assert detect_language(None, detailed=True) == {
+        'language': 'unknown', 'confidence': 0.0, 'method': 'empty_text'
+    }
+
+
+def test_detection_config_is_read_only():
+    """Direct mutation fails loudly instead of being ignored by the detector snapshots"""
+    with pytest.raises(TypeError):
+        DETECTION_CONFIG['min_text_length'] = 1
+    assert get_detection_config() == dict(DETECTION_CONFIG)
+
+
+def test_detailed_results_share_read_only_config():
+    """Every detailed result of a config generation carries the same read-only detection_config"""
+    first = detect_language("Yeh bahut acha hai yaar", detailed=True)
+    second = detect_language("This is amazing!", detailed=True)
+
+    assert first['detection_config'] is second['detection_config']
+    assert first['detection_config'] == get_detection_config()
+    with pytest.raises(TypeError):
+        first['detection_config']['min_text_length'] = 1
+    assert json.loads(json.dumps(first))['detection_config'] == get_detection_config()
+
+
+def test_config_update_invalidates_cached_results(stub_model, restore_detection_config):
+    """A result cached before update_detection_config is not served after it"""
+    text = "I think this is the best one we have had in a long time"
+    before = detect_language(text, detailed=True)
+
+    update_detection_config(english_fast_path_enabled=True)
+    after = detect_language(text, detailed=True)
+
+    assert before['method'] != 'ascii_common_words_fast_path'
+    assert after['method'] == 'ascii_common_words_fast_path'
+    assert after['detection_config_version'] != before['detection_config_version']
+
+
+def test_mutating_detailed_result_does_not_corrupt_cache(stub_model):
+    """Changes to a returned dict, or the lists nested in it, stay out of later cached calls"""
+    text = "Yeh bahut acha hai yaar"
+    first = detect_language(text, detailed=True)
+    expected = copy.deepcopy(first)
+
+    first['language'] = 'changed'
+    first['composition']['script_counts']['latin'] = -1
+    first['ensemble_analysis']['glotlid_prediction']['all_predictions'].clear()
+    first['ensemble_analysis']['glotlid_prediction']['all_predictions'].append(('xxx', 'Latn', 1.0))
+
+    assert detect_language(text, detailed=True) == expected
+    assert len(stub_model.predicted_texts) == 1
@@ -0,0 +1,94 @@
+"""Tests for the GLotLID-free shortcuts in detect_language
+
+Each shortcut is checked with its config key enabled and disabled; the stub
+model records whether GLotLID was consulted.
+"""
+
+import pytest
+
+from preprocessing import language_detection
+from preprocessing import detect_language, detect_language_batch, update_detection_config
+
+ENGLISH_TEXT = "I think this is the best one we have had in a long time"
+
+
+@pytest.mark.parametrize("detailed", [False, True])
+def test_english_fast_path_enabled(stub_model, restore_detection_config, detailed):
+    update_detection_config(english_fast_path_enabled=True)
+
+    result = detect_language(ENGLISH_TEXT, detailed=detailed)
+
+    if detailed:
+        assert (result['language'], result['method']) == ('eng', 'ascii_common_words_fast_path')
+    else:
+        assert result == 'eng'
+    assert stub_model.predicted_texts == []
+
+
+def test_english_fast_path_disabled(stub_model, restore_detection_config):
+    update_detection_config(english_fast_path_enabled=False)
+
+    result = detect_language(ENGLISH_TEXT, detailed=True)
+
+    assert result['method'] != 'ascii_common_words_fast_path'
+    assert stub_model.predicted_texts == [ENGLISH_TEXT]
+
+
+@pytest.mark.parametrize("enabled", [False, True])
+def test_fast_path_predicates_run_once_per_text(stub_model, restore_detection_config, monkeypatch, enabled):
+    """The shortcut decision is shared by the GLotLID gate and the pipeline"""
+    update_detection_config(english_fast_path_enabled=enabled)
+    calls = []
+    predicate = language_detection._is_common_english_fast_path
+    monkeypatch.setattr(language_detection, '_is_common_english_fast_path',
+                        lambda text: calls.append(text) or predicate(text))
+
+    detect_language(ENGLISH_TEXT)
+    detect_language_batch(["Esto es terrible"])
+
+    assert calls == [ENGLISH_TEXT, "Esto es terrible"]
+
+
+@pytest.mark.parametrize("text, expected", [
+    ("मी घरी जातो आहे", 'hi'),
+    ("আমি ভালো আছি 123!", 'ben'),
+    ("நான் நன்றாக இருக்கிறேன்", 'tam'),
+])
+def test_pure_script_fast_path_enabled(stub_model, restore_detection_config, text, expected):
+    update_detection_config(script_fast_path_enabled=True)
+
+    result = detect_language(text, detailed=True)
+
+    assert (result['method'], result['confidence']) == ('pure_script_fast_path', 0.95)
+    assert detect_language(text) == expected
+    assert stub_model.predicted_texts == []
+
+
+def test_pure_script_fast_path_disabled(stub_model, restore_detection_config):
+    update_detection_config(script_fast_path_enabled=False)
+
+    assert detect_language("मी घरी जातो आहे", detailed=True)['method'] != 'pure_script_fast_path'
+    assert stub_model.predicted_texts == ["मी घरी जातो आहे"]
+
+
+@pytest.mark.parametrize("text", [
+    "मी घरी जातो আছি",           # two Indic blocks
+    "आज weather बहुत अच्छा है",  # Latin letters
+])
+def test_pure_script_fast_path_needs_one_block_and_no_latin(stub_model, restore_detection_config, text):
+    update_detection_config(script_fast_path_enabled=True)
+
+    assert detect_language(text, detailed=True)['method'] != 'pure_script_fast_path'
+    assert stub_model.predicted_texts == [text]
+
+
+@pytest.mark.parametrize("text", [":-)", "123", " !! ", "<3"])
+@pytest.mark.parametrize("detailed", [False, True])
+def test_letterless_very_short_text_skips_glotlid(stub_model, text, detailed):
+    result = detect_language(text, detailed=detailed)
+
+    if detailed:
+        assert (result['language'], result['method']) == ('unknown', 'very_short_ascii_skip')
+    else:
+        assert result == 'unknown'
+    assert stub_model.predicted_texts == []
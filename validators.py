@@ -159,22 +159,47 @@ def validate_inputs(**validators: Callable):
             pass
     """
     def decorator(func):
+        # Resolve the signature once; inspect.signature is far costlier than the checks
+        sig = inspect.signature(func)
+        
+        # Fast path for the usual call shape, where every validated parameter is
+        # passed positionally: read the values from args instead of binding
+        positional_names = [
+            name for name, param in sig.parameters.items()
+            if param.kind in (param.POSITIONAL_ONLY, param.POSITIONAL_OR_KEYWORD)
+        ]
+        validated_names = [name for name in validators if name in sig.parameters]
+        if all(name in positional_names for name in validated_names):
+            positional_checks = [(positional_names.index(name), validators[name]) for name in validated_names]
+            min_positional = max((index for index, _ in positional_checks), default=-1) + 1
+        else:
+            positional_checks = None
+        # Names already bound by the first n positional arguments, to spot duplicates
+        positional_prefixes = [frozenset(positional_names[:n]) for n in range(len(positional_names) + 1)]
+        
+        def check(validator, value):
+            if value is not None:  # Skip None values
+                try:
+                    validator(value)
+                except ValidationError as e:
+                    raise ValidationError(f"In {func.__name__}: {e}")
+        
         @wraps(func)
         def wrapper(*args, **kwargs):
-            # Get function signature
-            sig = inspect.signature(func)
+            n_args = len(args)
+            if (positional_checks is not None and min_positional <= n_args <= len(positional_names)
+                    and (not kwargs or positional_prefixes[n_args].isdisjoint(kwargs))):
+                for index, validator in positional_checks:
+                    check(validator, args[index])
+                return func(*args, **kwargs)
+            
             bound_args = sig.bind(*args, **kwargs)
             bound_args.apply_defaults()
             
             # Validate each parameter
             for param_name, validator in validators.items():
                 if param_name in bound_args.arguments:
-                    value = bound_args.arguments[param_name]
-                    if value is not None:  # Skip None values
-                        try:
-                            validator(value)
-                        except ValidationError as e:
-                            raise ValidationError(f"In {func.__name__}: {e}")
+                    check(validator, bound_args.arguments[param_name])
             
             return func(*args, **kwargs)
         